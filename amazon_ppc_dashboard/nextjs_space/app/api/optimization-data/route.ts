@@ -0,0 +1,60 @@
+import { NextRequest, NextResponse } from 'next/server';
+
+export async function POST(request: NextRequest) {
+  try {
+    // Verify API key
+    const apiKey = process.env.DASHBOARD_API_KEY;
+    const authHeader = request.headers.get('authorization');
+    const bearerToken = authHeader?.startsWith('Bearer ')
+      ? authHeader.slice(7)
+      : authHeader || undefined;
+    const headerApiKey = request.headers.get('x-api-key') ?? undefined;
+
+    if (apiKey) {
+      if (bearerToken !== apiKey && headerApiKey !== apiKey) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+    } else {
+      console.warn('DASHBOARD_API_KEY is not set. Skipping authentication.');
+    }
+
+    // The sync service sends either a JSON document (full / per-run
+    // syncs) or NDJSON, one record per line (streamed backfills)
+    const contentType = request.headers.get('content-type') ?? '';
+    let body: unknown;
+    if (contentType.includes('application/x-ndjson')) {
+      const text = await request.text();
+      body = text
+        .split('\n')
+        .filter((line) => line.trim().length > 0)
+        .map((line) => JSON.parse(line));
+    } else {
+      body = await request.json();
+    }
+
+    // Log the sync payload
+    console.log(
+      'BigQuery sync payload received:',
+      Array.isArray(body) ? `${body.length} records` : Object.keys(body as object)
+    );
+
+    // TODO: Store in your database
+    // Example payload shapes:
+    // - { synced_at, optimization_results: [...], campaign_details: [...] }
+    //   from a full 7-day sync
+    // - { run: {...} } from a single-run sync
+    // - { data: [...], run_ids: [...] } from a multi-run sync
+    // - NDJSON lines of optimization result rows from a streamed backfill
+
+    return NextResponse.json({
+      success: true,
+      received: true
+    }, { status: 200 });
+
+  } catch (error) {
+    console.error('Error processing sync payload:', error);
+    return NextResponse.json({
+      error: 'Internal server error'
+    }, { status: 500 });
+  }
+}
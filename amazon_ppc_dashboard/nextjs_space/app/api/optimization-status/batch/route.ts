@@ -0,0 +1,50 @@
+import { NextRequest, NextResponse } from 'next/server';
+
+export async function POST(request: NextRequest) {
+  try {
+    // Verify API key
+    const apiKey = process.env.DASHBOARD_API_KEY;
+    const authHeader = request.headers.get('authorization');
+    const bearerToken = authHeader?.startsWith('Bearer ')
+      ? authHeader.slice(7)
+      : authHeader || undefined;
+    const headerApiKey = request.headers.get('x-api-key') ?? undefined;
+
+    if (apiKey) {
+      if (bearerToken !== apiKey && headerApiKey !== apiKey) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+    } else {
+      console.warn('DASHBOARD_API_KEY is not set. Skipping authentication.');
+    }
+
+    const body = await request.json();
+    const events = Array.isArray(body?.events) ? body.events : [];
+
+    // Log the batched status updates
+    console.log(
+      `Optimization status batch for run ${body?.run_id}: ${events.length} events`
+    );
+
+    // TODO: Store in your database
+    // Example fields in body:
+    // - run_id: unique identifier for this run (shared by all events)
+    // - events: array of status events, each with:
+    //   - status: 'started' | 'running' | 'completed'
+    //   - timestamp: ISO timestamp
+    //   - profile_id: Amazon profile ID
+    //   - message: optional progress message
+    //   - percent_complete: optional progress percentage
+
+    return NextResponse.json({
+      success: true,
+      received: events.length
+    }, { status: 200 });
+
+  } catch (error) {
+    console.error('Error processing status batch:', error);
+    return NextResponse.json({
+      error: 'Internal server error'
+    }, { status: 500 });
+  }
+}
@@ -14,28 +14,173 @@ Author: Nature's Way Soil
 Version: 1.0.0
 """
 
-import base64
+import atexit
+import concurrent.futures
+import functools
 import logging
 import json
 import os
+import tempfile
+import threading
+import time
 import traceback
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, TYPE_CHECKING
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
-from google.oauth2 import service_account
-from google.api_core import exceptions as core_exceptions
+
+if TYPE_CHECKING:
+    from google.oauth2 import service_account
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, default=str)
+
+
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _insert_retry():
+    """Shared retry policy for streaming inserts: exponential backoff on
+    transient errors (429/500/503), giving up after two minutes."""
+
+    from google.api_core.retry import Retry, if_transient_error
+
+    return Retry(
+        initial=1.0,
+        maximum=30.0,
+        multiplier=2.0,
+        deadline=120.0,
+        predicate=if_transient_error,
+    )
+
+
+# Streaming inserts are capped at 50,000 rows / ~10 MB per request; Google
+# recommends ~500 rows per request for best throughput
+_CHUNK_SIZE = 500
+
+# How long queued single-row writes may wait before the background
+# flusher coalesces them into one insert request
+_FLUSH_INTERVAL_SECONDS = 2.0
+
+# Row count at which bulk writes switch from streaming inserts (billed per
+# MB, rate-limited) to a free batch load job
+_LOAD_JOB_THRESHOLD = 1000
+
+# How long a dataset/table existence check stays valid before the next
+# write re-verifies it (tables are occasionally dropped out-of-band by
+# cleanup scripts, so "exists" is not memoized forever)
+_EXISTENCE_TTL_SECONDS = 300.0
+
+# Client-side progress throttle: drop updates that are both younger than
+# this and moved less than _PROGRESS_MIN_DELTA_PCT since the last one sent
+# (dashboards sample at ~1 Hz; finer ticks just burn streaming quota)
+_PROGRESS_MIN_INTERVAL_SECONDS = 1.0
+_PROGRESS_MIN_DELTA_PCT = 1.0
+
+# Stale-while-revalidate windows for the MAX(timestamp) getters: results
+# younger than the fresh window are served directly; older ones are served
+# stale while a background query refreshes them, up to the stale ceiling
+_TS_CACHE_FRESH_SECONDS = 30.0
+_TS_CACHE_STALE_SECONDS = 300.0
+
 RUN_EVENTS_TABLE = "optimizer_run_events"
-RUN_EVENTS_SCHEMA = [
+RUN_EVENTS_SCHEMA = (
     bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
     bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
     bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
     bigquery.SchemaField("details", "STRING"),
-]
+)
+
+OPTIMIZATION_RESULTS_TABLE = "optimization_results"
+OPTIMIZATION_RESULTS_SCHEMA = (
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("profile_id", "STRING"),
+    bigquery.SchemaField("dry_run", "BOOLEAN"),
+    bigquery.SchemaField("duration_seconds", "FLOAT"),
+    bigquery.SchemaField("campaigns_analyzed", "INTEGER"),
+    bigquery.SchemaField("keywords_optimized", "INTEGER"),
+    bigquery.SchemaField("bids_increased", "INTEGER"),
+    bigquery.SchemaField("bids_decreased", "INTEGER"),
+    bigquery.SchemaField("negative_keywords_added", "INTEGER"),
+    bigquery.SchemaField("budget_changes", "INTEGER"),
+    bigquery.SchemaField("total_spend", "FLOAT"),
+    bigquery.SchemaField("total_sales", "FLOAT"),
+    bigquery.SchemaField("average_acos", "FLOAT"),
+    bigquery.SchemaField("target_acos", "FLOAT"),
+    bigquery.SchemaField("lookback_days", "INTEGER"),
+    bigquery.SchemaField("enabled_features", "STRING", mode="REPEATED"),
+    bigquery.SchemaField("errors", "STRING", mode="REPEATED"),
+    bigquery.SchemaField("warnings", "STRING", mode="REPEATED"),
+)
+
+CAMPAIGN_DETAILS_TABLE = "campaign_details"
+CAMPAIGN_DETAILS_SCHEMA = (
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("campaign_id", "STRING"),
+    bigquery.SchemaField("campaign_name", "STRING"),
+    bigquery.SchemaField("spend", "FLOAT"),
+    bigquery.SchemaField("sales", "FLOAT"),
+    bigquery.SchemaField("acos", "FLOAT"),
+    bigquery.SchemaField("impressions", "INTEGER"),
+    bigquery.SchemaField("clicks", "INTEGER"),
+    bigquery.SchemaField("conversions", "INTEGER"),
+    bigquery.SchemaField("budget", "FLOAT"),
+    bigquery.SchemaField("status", "STRING"),
+)
+
+OPTIMIZATION_PROGRESS_TABLE = "optimization_progress"
+OPTIMIZATION_PROGRESS_SCHEMA = (
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("status", "STRING"),
+    bigquery.SchemaField("message", "STRING"),
+    bigquery.SchemaField("percent_complete", "FLOAT"),
+    bigquery.SchemaField("profile_id", "STRING"),
+)
+
+OPTIMIZATION_ERRORS_TABLE = "optimization_errors"
+OPTIMIZATION_ERRORS_SCHEMA = (
+    bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("status", "STRING"),
+    bigquery.SchemaField("profile_id", "STRING"),
+    bigquery.SchemaField("error_type", "STRING"),
+    bigquery.SchemaField("error_message", "STRING"),
+    bigquery.SchemaField("traceback", "STRING"),
+    bigquery.SchemaField("context", "STRING"),
+)
+
+# Lookup used by the queue flusher and optimistic-insert helper to create a
+# missing table from its table ID alone
+_TABLE_SCHEMAS = {
+    RUN_EVENTS_TABLE: RUN_EVENTS_SCHEMA,
+    OPTIMIZATION_RESULTS_TABLE: OPTIMIZATION_RESULTS_SCHEMA,
+    CAMPAIGN_DETAILS_TABLE: CAMPAIGN_DETAILS_SCHEMA,
+    OPTIMIZATION_PROGRESS_TABLE: OPTIMIZATION_PROGRESS_SCHEMA,
+    OPTIMIZATION_ERRORS_TABLE: OPTIMIZATION_ERRORS_SCHEMA,
+}
 
 
 def _combine_split_env_value(base_name: str) -> Optional[str]:
@@ -94,6 +239,187 @@ def _get_env_value_with_parts(*names: str) -> Optional[str]:
     return None
 
 
+# Process-wide bigquery.Client instances keyed by project ID. Sharing one
+# client (and its pooled HTTP session) across BigQueryClient instances avoids
+# a fresh TLS handshake and connection pool per instance.
+_SHARED_CLIENTS: Dict[str, bigquery.Client] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _pooled_http_session(credentials=None):
+    """Build an authorized session with an enlarged connection pool.
+
+    Returns None when the transport helpers (or default credentials) are
+    unavailable, in which case the caller falls back to the client's default
+    transport.
+    """
+
+    try:
+        import google.auth
+        from google.auth.transport.requests import AuthorizedSession
+        from requests.adapters import HTTPAdapter
+
+        if credentials is None:
+            credentials, _ = google.auth.default()
+
+        session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    except Exception as exc:
+        logger.debug(f"Falling back to default BigQuery transport: {exc}")
+        return None
+
+
+def _get_shared_client(project_id: str, credentials=None) -> bigquery.Client:
+    """Return (creating if needed) the shared client for a project.
+
+    Thread-safe. All instances for the same project reuse one client and its
+    pooled HTTPS connections.
+    """
+
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(project_id)
+        if client is None:
+            http = _pooled_http_session(credentials)
+            if credentials:
+                client = bigquery.Client(
+                    project=project_id, credentials=credentials, _http=http
+                )
+            else:
+                client = bigquery.Client(project=project_id, _http=http)
+            _SHARED_CLIENTS[project_id] = client
+        return client
+
+
+# Mapping of BigQuery column types to protobuf field types for the Storage
+# Write API. TIMESTAMP is sent as an RFC 3339 string, which the backend
+# parses natively.
+_BQ_TO_PROTO_TYPE = {
+    "STRING": 9,     # TYPE_STRING
+    "TIMESTAMP": 9,  # TYPE_STRING (RFC 3339)
+    "FLOAT": 1,      # TYPE_DOUBLE
+    "INTEGER": 3,    # TYPE_INT64
+    "BOOLEAN": 8,    # TYPE_BOOL
+}
+
+
+class StorageWriteSink:
+    """
+    Append rows to BigQuery via the Storage Write API default stream.
+
+    The Storage Write API multiplexes appends over one gRPC stream and is the
+    modern, cheaper replacement for the legacy tabledata.insertAll streaming
+    path. Rows are serialized as protobuf messages generated dynamically from
+    the table's SchemaField definitions.
+
+    Construction raises when google-cloud-bigquery-storage is unavailable;
+    callers should catch and fall back to insert_rows_json.
+    """
+
+    def __init__(self, project_id: str, dataset_id: str, table_id: str,
+                 schema: Sequence[bigquery.SchemaField], credentials=None):
+        from google.cloud.bigquery_storage_v1 import BigQueryWriteClient, types, writer
+        from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+        self.table_id = table_id
+        self._types = types
+
+        self._message_class = self._build_message_class(
+            table_id, schema, descriptor_pb2, descriptor_pool, message_factory
+        )
+
+        write_client = BigQueryWriteClient(credentials=credentials)
+        stream_name = (
+            f"projects/{project_id}/datasets/{dataset_id}/tables/{table_id}/_default"
+        )
+
+        proto_descriptor = descriptor_pb2.DescriptorProto()
+        self._message_class.DESCRIPTOR.CopyToProto(proto_descriptor)
+
+        proto_schema = types.ProtoSchema()
+        proto_schema.proto_descriptor = proto_descriptor
+
+        request_template = types.AppendRowsRequest()
+        request_template.write_stream = stream_name
+        proto_data = types.AppendRowsRequest.ProtoData()
+        proto_data.writer_schema = proto_schema
+        request_template.proto_rows = proto_data
+
+        self._stream = writer.AppendRowsStream(write_client, request_template)
+
+    @staticmethod
+    def _build_message_class(table_id, schema, descriptor_pb2, descriptor_pool,
+                             message_factory):
+        """Generate a protobuf message class matching the table schema."""
+        file_proto = descriptor_pb2.FileDescriptorProto()
+        file_proto.name = f"bq_{table_id}.proto"
+        file_proto.package = "nws.bigquery"
+        message_proto = file_proto.message_type.add()
+        message_proto.name = f"Row_{table_id}"
+
+        for index, field in enumerate(schema, start=1):
+            field_proto = message_proto.field.add()
+            field_proto.name = field.name
+            field_proto.number = index
+            field_proto.type = _BQ_TO_PROTO_TYPE.get(field.field_type, 9)
+            # 3 = LABEL_REPEATED, 1 = LABEL_OPTIONAL
+            field_proto.label = 3 if field.mode == "REPEATED" else 1
+
+        pool = descriptor_pool.DescriptorPool()
+        file_descriptor = pool.Add(file_proto)
+        descriptor = file_descriptor.message_types_by_name[message_proto.name]
+        return message_factory.GetMessageClass(descriptor)
+
+    def append_rows(self, rows: List[Dict]) -> None:
+        """Append row dicts to the default stream (blocks until acked)."""
+        proto_rows = self._types.ProtoRows()
+        for row in rows:
+            message = self._message_class()
+            for key, value in row.items():
+                if value is None:
+                    continue
+                if isinstance(value, (list, tuple)):
+                    getattr(message, key).extend(str(item) for item in value)
+                else:
+                    setattr(message, key, value)
+            proto_rows.serialized_rows.append(message.SerializeToString())
+
+        request = self._types.AppendRowsRequest()
+        proto_data = self._types.AppendRowsRequest.ProtoData()
+        proto_data.rows = proto_rows
+        request.proto_rows = proto_data
+        self._stream.send(request).result(timeout=30)
+
+
+def _as_str_list(values: Any) -> List[str]:
+    """Coerce a payload field to a list of strings.
+
+    Returns the input unchanged when callers already pass List[str] (the
+    common case), avoiding a pointless copy with per-element str() calls.
+    """
+
+    if not isinstance(values, list):
+        return []
+    if all(isinstance(v, str) for v in values):
+        return values
+    return [str(v) for v in values]
+
+
+def _iter_chunks(iterable, size: int):
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+
+    chunk: List[Any] = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 def _normalise_timestamp(value: Optional[datetime]) -> Optional[datetime]:
     """Convert BigQuery timestamps to naive UTC datetimes."""
 
@@ -106,6 +432,67 @@ def _normalise_timestamp(value: Optional[datetime]) -> Optional[datetime]:
     return value
 
 
+
+@functools.lru_cache(maxsize=8)
+def _credentials_from_sources(credential_sources: tuple) -> Optional["service_account.Credentials"]:
+    """Parse service account credentials from (source_name, raw_value) pairs.
+
+    Keyed on the raw env values so repeated BigQueryClient construction
+    doesn't re-read files or re-parse JSON. Call
+    _credentials_from_sources.cache_clear() in tests that mutate the env.
+    """
+
+    # Deferred: only needed when explicit credentials are configured, and
+    # importing it at module scope drags in the whole google-auth tree
+    # before the client is ever constructed
+    import base64
+    from google.oauth2 import service_account
+
+    for source_name, raw_value in credential_sources:
+        # If the environment variable points to a file path, let google-auth handle it
+        if os.path.isfile(raw_value):
+            try:
+                logger.debug(f"Loading BigQuery credentials from file path in {source_name}")
+                return service_account.Credentials.from_service_account_file(raw_value)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to load service account credentials from %s path: %s", source_name, exc
+                )
+                continue
+
+        # Otherwise treat the value as JSON credentials
+        try:
+            logger.debug(f"Attempting to parse service account JSON from {source_name}")
+            credentials_info = _json_loads(raw_value)
+        except ValueError:
+            # Some deployments (e.g. GitHub/Vercel secrets) provide base64 encoded JSON
+            try:
+                decoded_value = base64.b64decode(raw_value).decode("utf-8")
+                logger.debug(
+                    "Value in %s appeared to be base64 encoded; attempting to decode and parse JSON",
+                    source_name,
+                )
+                credentials_info = _json_loads(decoded_value)
+            except Exception:
+                logger.debug(
+                    "Value in %s is not JSON or base64 encoded JSON; assuming Application Default Credentials will be used",
+                    source_name,
+                )
+                continue
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to load service account credentials from %s: %s", source_name, exc)
+            continue
+
+        if isinstance(credentials_info, dict) and credentials_info.get("type") == "service_account":
+            return service_account.Credentials.from_service_account_info(credentials_info)
+
+        logger.warning(
+            "Environment variable %s did not contain valid service account credentials", source_name
+        )
+
+    return None
+
+
 class BigQueryClient:
     """
     Client for writing PPC optimization data to BigQuery
@@ -118,33 +505,152 @@ class BigQueryClient:
     """
     
     def __init__(self, project_id: str, dataset_id: str = 'amazon_ppc',
-                 location: str = 'us-east4'):
+                 location: str = 'us-east4',
+                 client: Optional[bigquery.Client] = None,
+                 write_dry_run_details: bool = False,
+                 allow_duplicate_rows: bool = True):
         """
         Initialize BigQuery client
-        
+
         Args:
             project_id: Google Cloud project ID
             dataset_id: BigQuery dataset ID (default: amazon_ppc)
             location: BigQuery dataset location (default: us-east4)
+            client: Optional pre-built bigquery.Client (default: a shared
+                per-project client with a pooled HTTP transport)
+            write_dry_run_details: Also stream per-campaign rows for dry
+                runs (default: False; dry-run rows never correspond to real
+                changes and just burn streaming quota)
+            allow_duplicate_rows: Skip insertId-based deduplication on
+                streaming inserts (default: True). This lifts the dedup
+                throughput ceiling, but a retried request may land the
+                same row twice; pass False for best-effort dedup if
+                duplicate telemetry rows are unacceptable.
         """
         self.project_id = project_id
         self.dataset_id = dataset_id
         self.location = location
+        self.write_dry_run_details = write_dry_run_details
+
+        # Skip auto-generated insertId values on streaming inserts. This lifts
+        # the 100k rows/s dedup ceiling to the 1 GB/s quota and avoids a UUID4
+        # per row, at the cost of at-least-once (not exactly-once) delivery -
+        # acceptable for this telemetry data.
+        self.skip_insert_ids = allow_duplicate_rows
 
-        credentials = self._resolve_credentials()
-        if credentials:
-            logger.info("Using explicit service account credentials for BigQuery client")
-            self.client = bigquery.Client(project=project_id, credentials=credentials)
-        else:
-            logger.debug("Using Application Default Credentials for BigQuery client")
-            self.client = bigquery.Client(project=project_id)
+        # The underlying bigquery.Client is built lazily on first use so
+        # constructing BigQueryClient never blocks on credentials or RPCs
+        # (see the client property / preflight())
+        self._credentials = None
+        self._client = client
+        self._client_ready = False
+        self._client_lock = threading.Lock()
         self.dataset_ref = f"{project_id}.{dataset_id}"
 
-        # Ensure dataset exists
+        # Fully-qualified table names, built once instead of re-formatting
+        # f-strings on every write (and usable as interned cache keys)
+        self._tables = {name: f"{self.dataset_ref}.{name}" for name in _TABLE_SCHEMAS}
+
+        # Tables verified (or created) by this process, mapped to the time of
+        # verification - lets the write paths skip the get_table round-trip
+        # until the TTL lapses
+        self._verified_tables: Dict[str, float] = {}
+        self._existence_lock = threading.Lock()
+        self._dataset_verified_at = 0.0
+
+        # Pool for submitting insert chunks concurrently; insert_rows_json is
+        # I/O-bound and the bigquery.Client is thread-safe for this usage
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+        # Micro-batch queue: single-row writes (progress updates) are buffered
+        # per table and coalesced into one insert by a background flusher,
+        # trading up to _FLUSH_INTERVAL_SECONDS of dashboard latency for far
+        # fewer streaming requests
+        self._queues: Dict[str, List[Dict]] = defaultdict(list)
+        self._queue_lock = threading.Lock()
+
+        # Storage Write API sinks, built lazily per table. Disabled for the
+        # whole process after the first failure (e.g. library not installed)
+        # so every write doesn't retry the import.
+        self._storage_sinks: Dict[str, StorageWriteSink] = {}
+        self._storage_write_enabled = True
+
+        # Rows that exhausted their retries are appended here as JSONL and
+        # replayed by the next successful insert, so transient outages cost
+        # latency instead of data
+        self._failed_rows_path = os.environ.get('BQ_FAILED_ROWS_PATH') or os.path.join(
+            tempfile.gettempdir(), f"bq-failed-rows-{dataset_id}.jsonl"
+        )
+        self._failed_rows_lock = threading.Lock()
+        self._draining_failed_rows = False
+
+        # Last progress row sent per run_id: (percent, monotonic ts, status).
+        # Used to throttle near-duplicate progress ticks client-side.
+        self._last_progress: Dict[str, tuple] = {}
+
+        # Stale-while-revalidate cache for the MAX(timestamp) getters,
+        # keyed by (table, statuses) -> (value, fetched_at)
+        self._ts_cache: Dict[tuple, tuple] = {}
+        self._ts_cache_lock = threading.Lock()
+        self._ts_refreshing: set = set()
+
+        # In-flight futures from the *_async write variants; settled by flush()
+        self._pending: List[concurrent.futures.Future] = []
+        self._flush_wakeup = threading.Event()
+        self._flush_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="bq-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    @property
+    def client(self) -> bigquery.Client:
+        """The underlying bigquery.Client, built (and preflighted) on first use."""
+        if not self._client_ready:
+            self._initialize_client()
+        return self._client
+
+    def _initialize_client(self) -> None:
+        with self._client_lock:
+            if self._client_ready:
+                return
+            if self._client is None:
+                credentials = self._resolve_credentials()
+                self._credentials = credentials
+                if credentials:
+                    logger.info("Using explicit service account credentials for BigQuery client")
+                else:
+                    logger.debug("Using Application Default Credentials for BigQuery client")
+                self._client = _get_shared_client(self.project_id, credentials)
+            self._client_ready = True
+        # Outside the lock: preflight itself uses self.client. A second
+        # thread may briefly use the client before the dataset check lands,
+        # which is fine - every write path creates tables on demand.
+        self.preflight()
+
+    def preflight(self) -> None:
+        """Verify the dataset and warm the table existence cache.
+
+        Runs automatically on first client use; call it eagerly when
+        startup is the right place to pay the round-trips (e.g. tests,
+        long-lived workers).
+        """
         self._ensure_dataset_exists()
+        for table_id, schema in _TABLE_SCHEMAS.items():
+            try:
+                self._ensure_table_exists(table_id, schema)
+            except Exception as exc:
+                # Non-fatal: the write paths create tables on demand
+                logger.warning(f"Could not verify table {table_id} at startup: {exc}")
 
-    def _resolve_credentials(self) -> Optional[service_account.Credentials]:
-        """Attempt to load service account credentials from environment variables."""
+    def _resolve_credentials(self) -> Optional["service_account.Credentials"]:
+        """Attempt to load service account credentials from environment variables.
+
+        Parsing is memoized at module scope on the raw env values, so
+        constructing multiple clients (tests, per-profile workers) only
+        reads the file / parses the JSON once.
+        """
 
         # Prefer dedicated JSON credential environment variable used by deployment scripts
         credential_sources = []
@@ -171,52 +677,13 @@ class BigQueryClient:
                 google_source = "GOOGLE_APPLICATION_CREDENTIALS (split parts)"
             credential_sources.append((google_source, google_credentials_value))
 
-        for source_name, raw_value in credential_sources:
-            # If the environment variable points to a file path, let google-auth handle it
-            if os.path.isfile(raw_value):
-                try:
-                    logger.debug(f"Loading BigQuery credentials from file path in {source_name}")
-                    return service_account.Credentials.from_service_account_file(raw_value)
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to load service account credentials from %s path: %s", source_name, exc
-                    )
-                    continue
-
-            # Otherwise treat the value as JSON credentials
-            try:
-                logger.debug(f"Attempting to parse service account JSON from {source_name}")
-                credentials_info = json.loads(raw_value)
-            except json.JSONDecodeError:
-                # Some deployments (e.g. GitHub/Vercel secrets) provide base64 encoded JSON
-                try:
-                    decoded_value = base64.b64decode(raw_value).decode("utf-8")
-                    logger.debug(
-                        "Value in %s appeared to be base64 encoded; attempting to decode and parse JSON",
-                        source_name,
-                    )
-                    credentials_info = json.loads(decoded_value)
-                except Exception:
-                    logger.debug(
-                        "Value in %s is not JSON or base64 encoded JSON; assuming Application Default Credentials will be used",
-                        source_name,
-                    )
-                    continue
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("Failed to load service account credentials from %s: %s", source_name, exc)
-                continue
-
-            if isinstance(credentials_info, dict) and credentials_info.get("type") == "service_account":
-                return service_account.Credentials.from_service_account_info(credentials_info)
-
-            logger.warning(
-                "Environment variable %s did not contain valid service account credentials", source_name
-            )
-
-        return None
+        return _credentials_from_sources(tuple(credential_sources))
     
     def _ensure_dataset_exists(self):
-        """Create dataset if it doesn't exist"""
+        """Create dataset if it doesn't exist (verified result cached with a TTL)"""
+        with self._existence_lock:
+            if time.monotonic() - self._dataset_verified_at < _EXISTENCE_TTL_SECONDS:
+                return
         try:
             self.client.get_dataset(self.dataset_ref)
             logger.info(f"Dataset {self.dataset_ref} exists")
@@ -227,173 +694,473 @@ class BigQueryClient:
             dataset.description = "Amazon PPC Optimization data"
             self.client.create_dataset(dataset, timeout=30)
             logger.info(f"Created dataset {self.dataset_ref}")
+        with self._existence_lock:
+            self._dataset_verified_at = time.monotonic()
+
+    def _table_verified(self, table_id: str) -> bool:
+        """Whether a table existence check is still fresh under the TTL."""
+        with self._existence_lock:
+            verified_at = self._verified_tables.get(table_id)
+            return verified_at is not None and time.monotonic() - verified_at < _EXISTENCE_TTL_SECONDS
+
+    def _mark_table_verified(self, table_id: str):
+        with self._existence_lock:
+            self._verified_tables[table_id] = time.monotonic()
     
-    def _ensure_table_exists(self, table_id: str, schema: List[bigquery.SchemaField]):
-        """Create table if it doesn't exist"""
-        table_ref = f"{self.dataset_ref}.{table_id}"
+    def _table_ref(self, table_id: str) -> str:
+        """Fully-qualified table name (precomputed for the known tables)."""
+        ref = self._tables.get(table_id)
+        if ref is None:
+            ref = f"{self.dataset_ref}.{table_id}"
+            self._tables[table_id] = ref
+        return ref
+
+    def _create_table(self, table_id: str, schema: Sequence[bigquery.SchemaField]):
+        """Create a day-partitioned table from one of the module schemas."""
+        table_ref = self._table_ref(table_id)
+        logger.info(f"Creating table {table_ref}")
+        table = bigquery.Table(table_ref, schema=schema)
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY,
+            field="timestamp"
+        )
+        self.client.create_table(table, timeout=30, exists_ok=True)
+        logger.info(f"Created table {table_ref}")
+
+    def _ensure_table_exists(self, table_id: str, schema: Sequence[bigquery.SchemaField]):
+        """Create table if it doesn't exist (verified result cached with a TTL)"""
+        if self._table_verified(table_id):
+            return
+
+        table_ref = self._table_ref(table_id)
         try:
             self.client.get_table(table_ref)
             logger.debug(f"Table {table_ref} exists")
         except NotFound:
-            logger.info(f"Creating table {table_ref}")
-            table = bigquery.Table(table_ref, schema=schema)
-            table.time_partitioning = bigquery.TimePartitioning(
-                type_=bigquery.TimePartitioningType.DAY,
-                field="timestamp"
+            self._create_table(table_id, schema)
+
+        self._mark_table_verified(table_id)
+
+    def _insert_rows_with_create(self, table_id: str,
+                                 schema: Optional[Sequence[bigquery.SchemaField]],
+                                 rows: List[Dict]) -> List:
+        """Insert optimistically, creating the table only on NotFound.
+
+        Skips the pre-flight get_table round-trip entirely: steady-state
+        writes cost one HTTPS request, and the create-and-retry path only
+        runs the first time a table is genuinely missing.
+        """
+        table_ref = self._table_ref(table_id)
+        retry = _insert_retry()
+        try:
+            try:
+                errors = self.client.insert_rows_json(
+                    table_ref, rows, row_ids=self._insert_row_ids(rows), retry=retry
+                )
+            except NotFound:
+                if schema is None:
+                    raise
+                self._create_table(table_id, schema)
+                errors = self.client.insert_rows_json(
+                    table_ref, rows, row_ids=self._insert_row_ids(rows), retry=retry
+                )
+        except NotFound:
+            raise
+        except Exception:
+            # Retries exhausted - park the rows on disk for later replay
+            # rather than dropping them, then let the caller log the failure
+            self._buffer_failed_rows(table_id, rows)
+            raise
+        self._mark_table_verified(table_id)
+        self._drain_failed_rows()
+        return errors
+
+    def _buffer_failed_rows(self, table_id: str, rows: List[Dict]) -> None:
+        """Append rows that could not be inserted to the local replay buffer."""
+        try:
+            with self._failed_rows_lock:
+                with open(self._failed_rows_path, 'a', encoding='utf-8') as fh:
+                    for row in rows:
+                        fh.write(_json_dumps({"table": table_id, "row": row}))
+                        fh.write("\n")
+            logger.warning(
+                f"Buffered {len(rows)} undeliverable rows for {table_id} "
+                f"to {self._failed_rows_path}"
             )
-            self.client.create_table(table, timeout=30)
-            logger.info(f"Created table {table_ref}")
-    
-    def write_optimization_results(self, results_data: Dict) -> bool:
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.error(f"Could not buffer failed rows for {table_id}: {exc}")
+
+    def _drain_failed_rows(self) -> None:
+        """Replay any rows parked by earlier failed inserts.
+
+        Called after a successful insert, i.e. when BigQuery is demonstrably
+        reachable again. The buffer is claimed atomically under the lock so
+        concurrent drains can't double-send.
+        """
+        if not os.path.exists(self._failed_rows_path):
+            return
+        with self._failed_rows_lock:
+            # Replay goes through _insert_rows_with_create, which calls back
+            # into this method on success; don't recurse
+            if self._draining_failed_rows:
+                return
+            self._draining_failed_rows = True
+            try:
+                with open(self._failed_rows_path, 'r', encoding='utf-8') as fh:
+                    lines = fh.readlines()
+                os.remove(self._failed_rows_path)
+            except FileNotFoundError:
+                self._draining_failed_rows = False
+                return
+            except Exception as exc:  # pragma: no cover - best effort
+                logger.error(f"Could not read failed-row buffer: {exc}")
+                self._draining_failed_rows = False
+                return
+
+        try:
+            self._replay_buffered_rows(lines)
+        finally:
+            with self._failed_rows_lock:
+                self._draining_failed_rows = False
+
+    def _replay_buffered_rows(self, lines: List[str]) -> None:
+        replay: Dict[str, List[Dict]] = defaultdict(list)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = _json_loads(line)
+                replay[entry["table"]].append(entry["row"])
+            except Exception:
+                logger.warning("Skipping malformed buffered row")
+
+        for table_id, rows in replay.items():
+            for chunk in _iter_chunks(rows, _CHUNK_SIZE):
+                try:
+                    errors = self._insert_rows_with_create(
+                        table_id, _TABLE_SCHEMAS.get(table_id), chunk
+                    )
+                    if errors:
+                        logger.error(f"Errors replaying buffered rows to {table_id}: {errors}")
+                except Exception as exc:
+                    # _insert_rows_with_create re-buffers the chunk itself
+                    logger.warning(f"Replay of buffered rows to {table_id} failed: {exc}")
+
+    def _insert_row_ids(self, rows: List[Dict]):
+        """Row IDs for insert_rows_json honouring the skip_insert_ids flag."""
+        if self.skip_insert_ids:
+            return [None] * len(rows)
+        return bigquery.AutoRowIDs.GENERATE_UUID
+
+    def _get_storage_sink(self, table_id: str,
+                          schema: Sequence[bigquery.SchemaField]) -> Optional[StorageWriteSink]:
+        """Return the Storage Write sink for a table, or None if unavailable."""
+        if not self._storage_write_enabled:
+            return None
+
+        sink = self._storage_sinks.get(table_id)
+        if sink is None:
+            try:
+                sink = StorageWriteSink(
+                    self.project_id, self.dataset_id, table_id, schema,
+                    credentials=self._credentials,
+                )
+                self._storage_sinks[table_id] = sink
+            except Exception as exc:
+                logger.info(
+                    f"Storage Write API unavailable, using streaming inserts: {exc}"
+                )
+                self._storage_write_enabled = False
+                return None
+        return sink
+
+    def _load_rows_via_job(self, table_id: str, schema: Sequence[bigquery.SchemaField],
+                           rows, total: Optional[int] = None) -> bool:
+        """Write rows with a batch load job from an in-memory JSONL buffer.
+
+        Load jobs have no streaming cost and scale to millions of rows, so
+        they are preferred for large batches. ``rows`` may be any iterable of
+        row dicts; it is serialized straight into the buffer. Returns True on
+        success.
+        """
+        import io
+
+        try:
+            buf = io.BytesIO()
+            count = 0
+            write = buf.write
+            # Serializing ourselves (with orjson when installed) and handing
+            # the client a ready JSONL buffer is faster than
+            # load_table_from_json, which re-encodes row dicts with the
+            # stdlib encoder internally
+            if orjson is not None:
+                dumps = orjson.dumps
+                for row in rows:
+                    write(dumps(row, default=str))
+                    write(b"\n")
+                    count += 1
+            else:
+                dumps = json.dumps
+                for row in rows:
+                    write(dumps(row, default=str).encode("utf-8"))
+                    write(b"\n")
+                    count += 1
+            buf.seek(0)
+
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                schema=schema,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            )
+            table_ref = self._table_ref(table_id)
+            job = self.client.load_table_from_file(buf, table_ref, job_config=job_config)
+            job.result(timeout=60)
+            logger.info(f"Loaded {total or count} rows into {table_ref} via load job")
+            return True
+        except Exception as exc:
+            logger.warning(f"Load job for {table_id} failed, falling back to streaming: {exc}")
+            return False
+
+    def _enqueue(self, table_id: str, row: Dict) -> None:
+        """Buffer a row for the background flusher instead of inserting now."""
+        with self._queue_lock:
+            self._queues[table_id].append(row)
+            if len(self._queues[table_id]) >= _CHUNK_SIZE:
+                self._flush_wakeup.set()
+
+    def _flush_loop(self) -> None:
+        """Background thread: flush queued rows every interval or when full."""
+        while not self._flush_stop.is_set():
+            self._flush_wakeup.wait(timeout=_FLUSH_INTERVAL_SECONDS)
+            self._flush_wakeup.clear()
+            if self._flush_stop.is_set():
+                return
+            try:
+                self.flush()
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning(f"Background flush of queued BigQuery rows failed: {exc}")
+
+    def flush(self) -> None:
+        """Flush queued rows and settle any fire-and-forget write futures."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result(timeout=30)
+            except Exception as exc:
+                logger.warning(f"Async BigQuery write failed: {exc}")
+
+        with self._queue_lock:
+            pending = {table_id: rows for table_id, rows in self._queues.items() if rows}
+            self._queues.clear()
+
+        for table_id, rows in pending.items():
+            try:
+                schema = _TABLE_SCHEMAS.get(table_id)
+
+                # A big backlog (e.g. a whole buffered run) goes out as one
+                # free load job instead of many metered streaming requests
+                if schema is not None and len(rows) >= _LOAD_JOB_THRESHOLD:
+                    if self._load_rows_via_job(table_id, schema, rows):
+                        continue
+
+                # Prefer the gRPC Storage Write sink, matching the bulk write
+                # paths; fall back to chunked streaming inserts
+                sink = self._get_storage_sink(table_id, schema) if schema else None
+                if sink is not None:
+                    try:
+                        for chunk in _iter_chunks(rows, _CHUNK_SIZE):
+                            sink.append_rows(chunk)
+                        continue
+                    except Exception as exc:
+                        logger.warning(
+                            f"Storage Write flush for {table_id} failed, "
+                            f"falling back to streaming inserts: {exc}"
+                        )
+                for chunk in _iter_chunks(rows, _CHUNK_SIZE):
+                    errors = self._insert_rows_with_create(table_id, schema, chunk)
+                    if errors:
+                        logger.error(f"Error flushing queued rows to {table_id}: {errors}")
+            except Exception as exc:
+                logger.error(f"Failed to flush queued rows to {table_id}: {exc}")
+
+    def write_optimization_results(self, results_data: Dict, buffered: bool = False) -> bool:
         """
         Write optimization results to BigQuery
         
         Args:
             results_data: Complete results payload from dashboard_client
+            buffered: Queue the rows for the next flush() instead of
+                inserting now, coalescing a run's writes into one request
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Define schema for optimization_results table
-            schema = [
-                bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
-                bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("profile_id", "STRING"),
-                bigquery.SchemaField("dry_run", "BOOLEAN"),
-                bigquery.SchemaField("duration_seconds", "FLOAT"),
-                bigquery.SchemaField("campaigns_analyzed", "INTEGER"),
-                bigquery.SchemaField("keywords_optimized", "INTEGER"),
-                bigquery.SchemaField("bids_increased", "INTEGER"),
-                bigquery.SchemaField("bids_decreased", "INTEGER"),
-                bigquery.SchemaField("negative_keywords_added", "INTEGER"),
-                bigquery.SchemaField("budget_changes", "INTEGER"),
-                bigquery.SchemaField("total_spend", "FLOAT"),
-                bigquery.SchemaField("total_sales", "FLOAT"),
-                bigquery.SchemaField("average_acos", "FLOAT"),
-                bigquery.SchemaField("target_acos", "FLOAT"),
-                bigquery.SchemaField("lookback_days", "INTEGER"),
-                bigquery.SchemaField("enabled_features", "STRING", mode="REPEATED"),
-                bigquery.SchemaField("errors", "STRING", mode="REPEATED"),
-                bigquery.SchemaField("warnings", "STRING", mode="REPEATED"),
-            ]
-            
-            self._ensure_table_exists("optimization_results", schema)
-            
-            # Flatten the data for BigQuery
-            summary = results_data.get('summary', {})
-            config = results_data.get('config_snapshot', {})
             
+            # One canonical timestamp per call, shared with the campaign rows
+            # written below. Timezone-aware UTC matches BigQuery TIMESTAMP
+            # semantics without string-parse surprises.
+            now_iso = results_data.get('timestamp') or datetime.now(timezone.utc).isoformat()
+
+            # Flatten the data for BigQuery. Bind the .get methods once -
+            # the row build below does 17 lookups and each unbound .get is
+            # an attribute fetch plus a hash on every call.
+            _get = results_data.get
+            summary = _get('summary', {}) or {}
+            s_get = summary.get
+            config = _get('config_snapshot', {}) or {}
+            c_get = config.get
+
             # Ensure REPEATED fields are properly formatted as lists
-            enabled_features = config.get('enabled_features', [])
+            enabled_features = c_get('enabled_features', [])
             if not isinstance(enabled_features, list):
                 enabled_features = [str(enabled_features)]
-            
-            errors = results_data.get('errors', [])
-            if not isinstance(errors, list):
-                errors = []
-            errors = [str(e) for e in errors]
-            
-            warnings = results_data.get('warnings', [])
-            if not isinstance(warnings, list):
-                warnings = []
-            warnings = [str(w) for w in warnings]
-            
+
+            errors = _as_str_list(_get('errors', []))
+            warnings = _as_str_list(_get('warnings', []))
+
             row = {
-                "timestamp": results_data.get('timestamp', datetime.now().isoformat()),
-                "run_id": results_data.get('run_id'),
-                "status": results_data.get('status', 'success'),
-                "profile_id": results_data.get('profile_id', ''),
-                "dry_run": results_data.get('dry_run', False),
-                "duration_seconds": results_data.get('duration_seconds', 0),
-                "campaigns_analyzed": summary.get('campaigns_analyzed', 0),
-                "keywords_optimized": summary.get('keywords_optimized', 0),
-                "bids_increased": summary.get('bids_increased', 0),
-                "bids_decreased": summary.get('bids_decreased', 0),
-                "negative_keywords_added": summary.get('negative_keywords_added', 0),
-                "budget_changes": summary.get('budget_changes', 0),
-                "total_spend": summary.get('total_spend', 0.0),
-                "total_sales": summary.get('total_sales', 0.0),
-                "average_acos": summary.get('average_acos', 0.0),
-                "target_acos": config.get('target_acos', 0.0),
-                "lookback_days": config.get('lookback_days', 0),
+                "timestamp": now_iso,
+                "run_id": _get('run_id'),
+                "status": _get('status', 'success'),
+                "profile_id": _get('profile_id', ''),
+                "dry_run": _get('dry_run', False),
+                "duration_seconds": _get('duration_seconds', 0),
+                "campaigns_analyzed": s_get('campaigns_analyzed', 0),
+                "keywords_optimized": s_get('keywords_optimized', 0),
+                "bids_increased": s_get('bids_increased', 0),
+                "bids_decreased": s_get('bids_decreased', 0),
+                "negative_keywords_added": s_get('negative_keywords_added', 0),
+                "budget_changes": s_get('budget_changes', 0),
+                "total_spend": s_get('total_spend', 0.0),
+                "total_sales": s_get('total_sales', 0.0),
+                "average_acos": s_get('average_acos', 0.0),
+                "target_acos": c_get('target_acos', 0.0),
+                "lookback_days": c_get('lookback_days', 0),
                 "enabled_features": enabled_features,
                 "errors": errors,
                 "warnings": warnings,
             }
             
-            # Insert row
-            table_ref = f"{self.dataset_ref}.optimization_results"
-            errors = self.client.insert_rows_json(table_ref, [row])
-            
+            if buffered:
+                self._enqueue(OPTIMIZATION_RESULTS_TABLE, row)
+                self._write_campaign_details(results_data, timestamp=now_iso,
+                                             buffered=True)
+                return True
+
+            # Submit the summary row on the pool and write campaign details
+            # from this thread, so the two inserts overlap and the critical
+            # path is the slower of the two rather than their sum
+            summary_future = self._executor.submit(
+                self._insert_rows_with_create,
+                OPTIMIZATION_RESULTS_TABLE, OPTIMIZATION_RESULTS_SCHEMA, [row]
+            )
+
+            self._write_campaign_details(results_data, timestamp=now_iso)
+
+            errors = summary_future.result(timeout=60)
             if errors:
                 logger.error(f"Error inserting rows to BigQuery: {errors}")
                 return False
-            
+
             logger.info(f"Successfully wrote optimization results to BigQuery (run_id: {row['run_id']})")
-            
-            # Also write detailed campaign data
-            self._write_campaign_details(results_data)
-            
             return True
             
         except Exception as e:
             logger.error(f"Failed to write to BigQuery: {str(e)}")
             return False
     
-    def _write_campaign_details(self, results_data: Dict):
+    def _write_campaign_details(self, results_data: Dict,
+                                timestamp: Optional[str] = None,
+                                buffered: bool = False):
         """Write detailed campaign-level data"""
         try:
-            schema = [
-                bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
-                bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("campaign_id", "STRING"),
-                bigquery.SchemaField("campaign_name", "STRING"),
-                bigquery.SchemaField("spend", "FLOAT"),
-                bigquery.SchemaField("sales", "FLOAT"),
-                bigquery.SchemaField("acos", "FLOAT"),
-                bigquery.SchemaField("impressions", "INTEGER"),
-                bigquery.SchemaField("clicks", "INTEGER"),
-                bigquery.SchemaField("conversions", "INTEGER"),
-                bigquery.SchemaField("budget", "FLOAT"),
-                bigquery.SchemaField("status", "STRING"),
-            ]
-            
-            self._ensure_table_exists("campaign_details", schema)
-            
+            if results_data.get('dry_run') and not self.write_dry_run_details:
+                logger.debug("Dry run - skipping campaign detail write")
+                return
+
             campaigns = results_data.get('campaigns', [])
             if not campaigns:
                 return
-            
-            rows = []
-            timestamp = results_data.get('timestamp', datetime.now().isoformat())
+
+            if not buffered:
+                self._ensure_table_exists(CAMPAIGN_DETAILS_TABLE, CAMPAIGN_DETAILS_SCHEMA)
+
+            if timestamp is None:
+                timestamp = results_data.get('timestamp') or datetime.now(timezone.utc).isoformat()
             run_id = results_data.get('run_id')
-            
-            for campaign in campaigns:
-                row = {
-                    "timestamp": timestamp,
-                    "run_id": run_id,
-                    "campaign_id": campaign.get('campaign_id', ''),
-                    "campaign_name": campaign.get('name', ''),
-                    "spend": campaign.get('spend', 0.0),
-                    "sales": campaign.get('sales', 0.0),
-                    "acos": campaign.get('acos', 0.0),
-                    "impressions": campaign.get('impressions', 0),
-                    "clicks": campaign.get('clicks', 0),
-                    "conversions": campaign.get('conversions', 0),
-                    "budget": campaign.get('budget', 0.0),
-                    "status": campaign.get('status', ''),
-                }
-                rows.append(row)
-            
-            table_ref = f"{self.dataset_ref}.campaign_details"
-            errors = self.client.insert_rows_json(table_ref, rows)
-            
+
+            # Bind the method lookup once; the per-row dict build is pure
+            # interpreter overhead on accounts with thousands of campaigns.
+            # Rows are generated lazily so only one chunk's worth of dicts is
+            # resident at a time and the first insert starts immediately.
+            get = dict.get
+
+            def make_rows():
+                return (
+                    {
+                        "timestamp": timestamp,
+                        "run_id": run_id,
+                        "campaign_id": get(campaign, 'campaign_id', ''),
+                        "campaign_name": get(campaign, 'name', ''),
+                        "spend": get(campaign, 'spend', 0.0),
+                        "sales": get(campaign, 'sales', 0.0),
+                        "acos": get(campaign, 'acos', 0.0),
+                        "impressions": get(campaign, 'impressions', 0),
+                        "clicks": get(campaign, 'clicks', 0),
+                        "conversions": get(campaign, 'conversions', 0),
+                        "budget": get(campaign, 'budget', 0.0),
+                        "status": get(campaign, 'status', ''),
+                    }
+                    for campaign in campaigns
+                )
+
+            total = len(campaigns)
+
+            if buffered:
+                with self._queue_lock:
+                    self._queues[CAMPAIGN_DETAILS_TABLE].extend(make_rows())
+                return
+
+            # Large batches go through a free load job instead of metered
+            # streaming inserts
+            if total >= _LOAD_JOB_THRESHOLD:
+                if self._load_rows_via_job(CAMPAIGN_DETAILS_TABLE, CAMPAIGN_DETAILS_SCHEMA,
+                                           make_rows(), total):
+                    return
+
+            # Prefer the Storage Write API (protobuf over gRPC); fall back to
+            # legacy streaming inserts when it is unavailable
+            sink = self._get_storage_sink(CAMPAIGN_DETAILS_TABLE, CAMPAIGN_DETAILS_SCHEMA)
+            table_ref = self._tables[CAMPAIGN_DETAILS_TABLE]
+            use_sink = sink is not None
+
+            futures = []
+            for chunk in _iter_chunks(make_rows(), _CHUNK_SIZE):
+                if use_sink:
+                    try:
+                        sink.append_rows(chunk)
+                        continue
+                    except Exception as exc:
+                        logger.warning(
+                            f"Storage Write append failed, falling back to streaming inserts: {exc}"
+                        )
+                        use_sink = False
+                futures.append(self._executor.submit(
+                    self.client.insert_rows_json, table_ref, chunk, row_ids=self._insert_row_ids(chunk)
+                ))
+
+            errors = []
+            for future in concurrent.futures.as_completed(futures):
+                chunk_errors = future.result()
+                if chunk_errors:
+                    errors.extend(chunk_errors)
+
             if errors:
                 logger.error(f"Error inserting campaign details to BigQuery: {errors}")
             else:
-                logger.info(f"Successfully wrote {len(rows)} campaign details to BigQuery")
+                logger.info(f"Successfully wrote {total} campaign details to BigQuery")
                 
         except Exception as e:
             logger.error(f"Failed to write campaign details to BigQuery: {str(e)}")
@@ -418,26 +1185,11 @@ class BigQueryClient:
                 logger.warning("No budget data to insert")
                 return False
             
-            # Use the same schema as campaign_details table
-            schema = [
-                bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
-                bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("campaign_id", "STRING"),
-                bigquery.SchemaField("campaign_name", "STRING"),
-                bigquery.SchemaField("spend", "FLOAT"),
-                bigquery.SchemaField("sales", "FLOAT"),
-                bigquery.SchemaField("acos", "FLOAT"),
-                bigquery.SchemaField("impressions", "INTEGER"),
-                bigquery.SchemaField("clicks", "INTEGER"),
-                bigquery.SchemaField("conversions", "INTEGER"),
-                bigquery.SchemaField("budget", "FLOAT"),
-                bigquery.SchemaField("status", "STRING"),
-            ]
-            
-            self._ensure_table_exists("campaign_details", schema)
+            # Uses the same schema as the campaign_details table
+            self._ensure_table_exists(CAMPAIGN_DETAILS_TABLE, CAMPAIGN_DETAILS_SCHEMA)
             
             rows = []
-            timestamp = datetime.utcnow().isoformat()
+            timestamp = datetime.now(timezone.utc).isoformat()
             
             for campaign in budget_data:
                 row = {
@@ -456,9 +1208,28 @@ class BigQueryClient:
                 }
                 rows.append(row)
             
-            table_ref = f"{self.dataset_ref}.campaign_details"
-            errors = self.client.insert_rows_json(table_ref, rows)
-            
+            # Prefer the gRPC-backed Storage Write sink over REST streaming
+            sink = self._get_storage_sink(CAMPAIGN_DETAILS_TABLE, CAMPAIGN_DETAILS_SCHEMA)
+            if sink is not None:
+                try:
+                    for chunk in _iter_chunks(rows, _CHUNK_SIZE):
+                        sink.append_rows(chunk)
+                    logger.info(f"✅ Successfully inserted {len(rows)} campaign budgets via Storage Write API")
+                    return True
+                except Exception as exc:
+                    logger.warning(
+                        f"Storage Write append failed, falling back to streaming inserts: {exc}"
+                    )
+
+            # Chunk the fallback inserts as well so one oversized budget batch
+            # can't trip the 50k-row / 10 MB streaming request limits
+            table_ref = self._tables[CAMPAIGN_DETAILS_TABLE]
+            errors: List = []
+            for chunk in _iter_chunks(rows, _CHUNK_SIZE):
+                errors.extend(
+                    self.client.insert_rows_json(table_ref, chunk, row_ids=self._insert_row_ids(chunk))
+                )
+
             if errors:
                 logger.error(f"Error inserting campaign budgets to BigQuery: {errors}")
                 return False
@@ -475,85 +1246,100 @@ class BigQueryClient:
         """
         Write optimization progress update to BigQuery
         
+        Updates that arrived less than a second after the previous one and
+        moved percent_complete by under one point are dropped client-side;
+        status changes always go through.
+
         Args:
             progress_data: Progress update payload
             
         Returns:
-            True if successful, False otherwise
+            True if successful (or deliberately throttled), False otherwise
         """
         try:
-            schema = [
-                bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
-                bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("status", "STRING"),
-                bigquery.SchemaField("message", "STRING"),
-                bigquery.SchemaField("percent_complete", "FLOAT"),
-                bigquery.SchemaField("profile_id", "STRING"),
-            ]
-            
-            self._ensure_table_exists("optimization_progress", schema)
-            
+            run_id = progress_data.get('run_id')
+            status = progress_data.get('status', 'running')
+            pct = progress_data.get('percent_complete', 0.0)
+
+            if run_id:
+                last = self._last_progress.get(run_id)
+                now = time.monotonic()
+                if (last is not None and status == last[2]
+                        and now - last[1] < _PROGRESS_MIN_INTERVAL_SECONDS
+                        and abs(pct - last[0]) < _PROGRESS_MIN_DELTA_PCT):
+                    return True
+                self._last_progress[run_id] = (pct, now, status)
+
             row = {
-                "timestamp": progress_data.get('timestamp', datetime.now().isoformat()),
-                "run_id": progress_data.get('run_id'),
-                "status": progress_data.get('status', 'running'),
+                "timestamp": progress_data.get('timestamp') or datetime.now(timezone.utc).isoformat(),
+                "run_id": run_id,
+                "status": status,
                 "message": progress_data.get('message', ''),
-                "percent_complete": progress_data.get('percent_complete', 0.0),
+                "percent_complete": pct,
                 "profile_id": progress_data.get('profile_id', ''),
             }
             
-            table_ref = f"{self.dataset_ref}.optimization_progress"
-            errors = self.client.insert_rows_json(table_ref, [row])
-            
-            if errors:
-                logger.error(f"Error inserting progress update to BigQuery: {errors}")
-                return False
-            
+            # Progress rows are tiny and frequent - queue them for the
+            # background flusher rather than paying one request per row
+            self._enqueue(OPTIMIZATION_PROGRESS_TABLE, row)
             return True
             
         except Exception as e:
             logger.error(f"Failed to write progress update to BigQuery: {str(e)}")
             return False
-    
-    def write_error(self, error_data: Dict) -> bool:
+
+    def write_progress_update_async(self, progress_data: Dict) -> concurrent.futures.Future:
+        """
+        Fire-and-forget variant of write_progress_update
+
+        Submits the write to the insert thread pool and returns immediately,
+        keeping BigQuery latency off the optimizer's critical path. The
+        returned future is also tracked internally and settled by flush().
+
+        Args:
+            progress_data: Progress update payload
+
+        Returns:
+            Future resolving to the write_progress_update result
+        """
+        future = self._executor.submit(self.write_progress_update, progress_data)
+        self._pending.append(future)
+        return future
+
+    def write_error(self, error_data: Dict, buffered: bool = False) -> bool:
         """
         Write optimization error to BigQuery
 
         Args:
             error_data: Error data payload
+            buffered: Queue the row for the next flush() instead of
+                inserting now
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            schema = [
-                bigquery.SchemaField("timestamp", "TIMESTAMP", mode="REQUIRED"),
-                bigquery.SchemaField("run_id", "STRING", mode="REQUIRED"),
-                bigquery.SchemaField("status", "STRING"),
-                bigquery.SchemaField("profile_id", "STRING"),
-                bigquery.SchemaField("error_type", "STRING"),
-                bigquery.SchemaField("error_message", "STRING"),
-                bigquery.SchemaField("traceback", "STRING"),
-                bigquery.SchemaField("context", "STRING"),
-            ]
-            
-            self._ensure_table_exists("optimization_errors", schema)
             
             error_info = error_data.get('error', {})
             
             row = {
-                "timestamp": error_data.get('timestamp', datetime.now().isoformat()),
+                "timestamp": error_data.get('timestamp') or datetime.now(timezone.utc).isoformat(),
                 "run_id": error_data.get('run_id'),
                 "status": error_data.get('status', 'failed'),
                 "profile_id": error_data.get('profile_id', ''),
                 "error_type": error_info.get('type', ''),
                 "error_message": error_info.get('message', ''),
                 "traceback": error_info.get('traceback', ''),
-                "context": json.dumps(error_info.get('context', {})),
+                "context": _json_dumps(error_info.get('context', {})),
             }
             
-            table_ref = f"{self.dataset_ref}.optimization_errors"
-            errors = self.client.insert_rows_json(table_ref, [row])
+            if buffered:
+                self._enqueue(OPTIMIZATION_ERRORS_TABLE, row)
+                return True
+
+            errors = self._insert_rows_with_create(
+                OPTIMIZATION_ERRORS_TABLE, OPTIMIZATION_ERRORS_SCHEMA, [row]
+            )
             
             if errors:
                 logger.error(f"Error inserting error log to BigQuery: {errors}")
@@ -566,7 +1352,8 @@ class BigQueryClient:
             logger.error(f"Failed to write error to BigQuery: {str(e)}")
             return False
 
-    def record_run_event(self, run_id: str, status: str, details: Optional[Dict[str, Any]] = None) -> None:
+    def record_run_event(self, run_id: str, status: str, details: Optional[Dict[str, Any]] = None,
+                         buffered: bool = False) -> None:
         """Record lifecycle events for optimizer runs."""
 
         if not run_id or not status:
@@ -574,23 +1361,47 @@ class BigQueryClient:
             return
 
         try:
-            self._ensure_table_exists(RUN_EVENTS_TABLE, RUN_EVENTS_SCHEMA)
-
             payload = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "run_id": str(run_id),
                 "status": str(status),
-                "details": json.dumps(details, default=str) if details else None,
+                "details": _json_dumps(details) if details else None,
             }
 
-            table_ref = f"{self.dataset_ref}.{RUN_EVENTS_TABLE}"
-            errors = self.client.insert_rows_json(table_ref, [payload])
+            if buffered:
+                self._enqueue(RUN_EVENTS_TABLE, payload)
+                return
+
+            errors = self._insert_rows_with_create(
+                RUN_EVENTS_TABLE, RUN_EVENTS_SCHEMA, [payload]
+            )
 
             if errors:
                 logger.warning(f"Error inserting run event to BigQuery: {errors}")
         except Exception as exc:
             logger.debug(f"Failed to record run event in BigQuery: {exc}")
 
+    def record_run_event_async(self, run_id: str, status: str,
+                               details: Optional[Dict[str, Any]] = None) -> concurrent.futures.Future:
+        """
+        Fire-and-forget variant of record_run_event
+
+        Run events are emitted on the hot optimization path and their return
+        value is ignored, so submit the insert to the thread pool and return
+        immediately. The future is tracked internally and settled by flush().
+
+        Args:
+            run_id: Unique identifier for the optimizer run
+            status: Lifecycle status (e.g. started, completed, failed)
+            details: Optional context dict, serialized to JSON
+
+        Returns:
+            Future resolving when the event has been written
+        """
+        future = self._executor.submit(self.record_run_event, run_id, status, details)
+        self._pending.append(future)
+        return future
+
     def _execute_single_timestamp_query(
         self,
         query: str,
@@ -598,9 +1409,31 @@ class BigQueryClient:
     ) -> Optional[datetime]:
         """Execute a query expected to return a single timestamp column."""
 
+        from google.api_core import exceptions as core_exceptions
+
         try:
-            job = self.client.query(query, job_config=job_config)
-            result = job.result(timeout=30)
+            # query_and_wait uses the jobs.query fast path (one round-trip,
+            # no jobs.get polling), and MAX(timestamp) is trivially servable
+            # from the server-side query cache on repeat calls
+            if job_config is None:
+                job_config = bigquery.QueryJobConfig()
+            job_config.use_query_cache = True
+            result = self.client.query_and_wait(
+                query, job_config=job_config, wait_timeout=30
+            )
+
+            # Prefer the Arrow path: column access happens in C++ rather than
+            # per-row Python iteration. Falls back to the RowIterator when
+            # pyarrow isn't installed (to_arrow raises ValueError then).
+            try:
+                arrow_table = result.to_arrow()
+            except (ValueError, AttributeError):
+                arrow_table = None
+
+            if arrow_table is not None:
+                if arrow_table.num_rows and "last_run" in arrow_table.column_names:
+                    return _normalise_timestamp(arrow_table.column("last_run")[0].as_py())
+                return None
 
             for row in result:
                 candidate = getattr(row, "last_run", None)
@@ -617,8 +1450,56 @@ class BigQueryClient:
 
         return None
 
+    def _cached_timestamp_query(
+        self,
+        cache_key: tuple,
+        query: str,
+        job_config: Optional[bigquery.QueryJobConfig] = None,
+    ) -> Optional[datetime]:
+        """Stale-while-revalidate wrapper around _execute_single_timestamp_query.
+
+        Callers of the timestamp getters typically poll; running a full
+        query job per call costs seconds for a value that barely moves.
+        Fresh cache hits are returned directly; stale-but-recent hits are
+        returned immediately while a background refresh runs on the
+        executor; anything older is fetched synchronously.
+        """
+        now = time.monotonic()
+        with self._ts_cache_lock:
+            cached = self._ts_cache.get(cache_key)
+            if cached is not None:
+                value, fetched_at = cached
+                age = now - fetched_at
+                if age < _TS_CACHE_FRESH_SECONDS:
+                    return value
+                if age < _TS_CACHE_STALE_SECONDS:
+                    if cache_key not in self._ts_refreshing:
+                        self._ts_refreshing.add(cache_key)
+                        self._executor.submit(
+                            self._refresh_timestamp_cache, cache_key, query, job_config
+                        )
+                    return value
+
+        return self._refresh_timestamp_cache(cache_key, query, job_config)
+
+    def _refresh_timestamp_cache(
+        self,
+        cache_key: tuple,
+        query: str,
+        job_config: Optional[bigquery.QueryJobConfig] = None,
+    ) -> Optional[datetime]:
+        """Run the timestamp query and store the result in the cache."""
+        try:
+            value = self._execute_single_timestamp_query(query, job_config)
+            with self._ts_cache_lock:
+                self._ts_cache[cache_key] = (value, time.monotonic())
+            return value
+        finally:
+            with self._ts_cache_lock:
+                self._ts_refreshing.discard(cache_key)
+
     def get_last_run_event_timestamp(self, statuses: Optional[List[str]] = None) -> Optional[datetime]:
-        """Return the timestamp of the most recent run event."""
+        """Return the timestamp of the most recent run event (cached ~30s)."""
 
         table_ref = f"`{self.dataset_ref}.{RUN_EVENTS_TABLE}`"
         query = f"SELECT MAX(timestamp) AS last_run FROM {table_ref}"
@@ -630,10 +1511,47 @@ class BigQueryClient:
             )
             query += " WHERE status IN UNNEST(@statuses)"
 
-        return self._execute_single_timestamp_query(query, job_config)
+        cache_key = (RUN_EVENTS_TABLE, tuple(statuses or ()))
+        return self._cached_timestamp_query(cache_key, query, job_config)
+
+    def close(self) -> None:
+        """Flush queued rows and release the per-instance threads.
+
+        Must be called when the instance is done (main.py does so in
+        its teardown): the flusher thread, the executor, and the atexit
+        hook all hold references that would otherwise accumulate for
+        every client built on a warm instance.
+        """
+
+        self._flush_stop.set()
+        self._flush_wakeup.set()
+        self._flusher.join(timeout=30)
+        self.flush()
+        self._executor.shutdown(wait=True)
+        atexit.unregister(self.flush)
 
     def get_last_result_timestamp(self, statuses: Optional[List[str]] = None) -> Optional[datetime]:
-        """Return the timestamp of the most recent optimizer result."""
+        """Return the timestamp of the most recent optimizer result (cached ~30s).
+
+        Without a status filter the answer only needs day precision, so it is
+        read from partition metadata (effectively free) instead of scanning
+        the table.
+        """
+
+        if statuses is None:
+            # The table is day-partitioned on timestamp; the newest partition
+            # id is the last write day and costs zero bytes billed to read
+            partitions_query = (
+                "SELECT PARSE_TIMESTAMP('%Y%m%d', MAX(partition_id)) AS last_run "
+                f"FROM `{self.dataset_ref}.INFORMATION_SCHEMA.PARTITIONS` "
+                f"WHERE table_name = '{OPTIMIZATION_RESULTS_TABLE}' "
+                "AND partition_id NOT IN ('__NULL__', '__UNPARTITIONED__')"
+            )
+            cache_key = (OPTIMIZATION_RESULTS_TABLE, "__partitions__")
+            value = self._cached_timestamp_query(cache_key, partitions_query)
+            if value is not None:
+                return value
+            # Fall through to the full query (e.g. metadata views unavailable)
 
         table_ref = f"`{self.dataset_ref}.optimization_results`"
         query = f"SELECT MAX(timestamp) AS last_run FROM {table_ref}"
@@ -645,4 +1563,5 @@ class BigQueryClient:
             )
             query += " WHERE status IN UNNEST(@statuses)"
 
-        return self._execute_single_timestamp_query(query, job_config)
+        cache_key = (OPTIMIZATION_RESULTS_TABLE, tuple(statuses or ()))
+        return self._cached_timestamp_query(cache_key, query, job_config)
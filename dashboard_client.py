@@ -14,48 +14,66 @@ Author: Nature's Way Soil
 Version: 1.0.0
 """
 
+import copy
+import gzip
 import logging
+import queue
+import threading
+import traceback
 import time
-import uuid
-from datetime import datetime
+from collections import deque
 from typing import Dict, List, Optional, Any
+import json
 import requests
-from functools import wraps
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Request bodies above this size are gzip-compressed before upload
+_GZIP_THRESHOLD_BYTES = 4096
 
-def retry_with_backoff(max_attempts=3, initial_delay=2, max_delay=10):
-    """
-    Decorator for retry logic with exponential backoff
-    
-    Args:
-        max_attempts: Maximum number of retry attempts
-        initial_delay: Initial delay in seconds
-        max_delay: Maximum delay between retries
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# (whole-second epoch, formatted prefix) - progress loops stamp many
+# payloads within the same second, so the strftime result is reused until
+# the clock ticks over. Tuple swap is atomic in CPython, so no lock.
+_ISO_CACHE = (0, '')
+
+
+def _iso_now() -> str:
+    """Local-time ISO timestamp, equivalent to datetime.now().isoformat().
+
+    strftime only runs when the whole-second part changes; within a
+    second only the microsecond suffix is formatted.
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            delay = initial_delay
-            last_exception = None
-            
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except requests.exceptions.RequestException as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(f"Attempt {attempt + 1}/{max_attempts} failed: {str(e)}")
-                        logger.info(f"Retrying in {delay} seconds...")
-                        time.sleep(delay)
-                        delay = min(delay * 2, max_delay)
-                    else:
-                        logger.error(f"All {max_attempts} attempts failed: {str(e)}")
-            
-            raise last_exception
-        return wrapper
-    return decorator
+    global _ISO_CACHE
+    t = time.time()
+    secs = int(t)
+    cached_secs, prefix = _ISO_CACHE
+    if secs != cached_secs:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(secs))
+        _ISO_CACHE = (secs, prefix)
+    return f"{prefix}.{int((t % 1) * 1_000_000):06d}"
 
 
 class DashboardClient:
@@ -71,6 +89,24 @@ class DashboardClient:
     - API key authentication
     """
     
+    # Results payload skeleton: copying a dict allocated at its final size
+    # skips the incremental resize-and-rehash a 13-key literal goes through
+    _PAYLOAD_TEMPLATE = {
+        'timestamp': None,
+        'run_id': None,
+        'status': 'success',
+        'profile_id': None,
+        'dry_run': False,
+        'duration_seconds': 0.0,
+        'summary': None,
+        'features': None,
+        'campaigns': None,
+        'top_performers': None,
+        'errors': None,
+        'warnings': None,
+        'config_snapshot': None,
+    }
+
     def __init__(self, config: Dict):
         """
         Initialize dashboard client
@@ -85,11 +121,117 @@ class DashboardClient:
         self.enabled = dashboard_config.get('enabled', True)
         self.send_real_time_updates = dashboard_config.get('send_real_time_updates', True)
         self.timeout = dashboard_config.get('timeout', 30)
+        # Off by default: the Next.js routes read request.json() and
+        # Node does not transparently gunzip request bodies, so a
+        # compressed results payload would 500. Opt in only against a
+        # deployment that decompresses Content-Encoding: gzip.
+        self.compress_payload = dashboard_config.get('compress_payload', False)
         
         self.session = requests.Session()
         self.current_run_id = None
         self.profile_id = config.get('amazon_api', {}).get('profile_id', '')
-        
+
+        # One pooled keep-alive connection serves every send_progress/
+        # send_results/send_error call; without the adapter each request
+        # could pay a fresh TCP+TLS handshake to the dashboard host.
+        # Retries live in the transport: urllib3 re-sends the already
+        # serialized body on transient failures (and honours Retry-After
+        # on 429) without re-entering any Python-level retry loop or
+        # rebuilding the payload
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=8,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['POST', 'GET'],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Progress events are buffered and shipped in one batch POST
+        # instead of a round trip per tick; the deque bound keeps memory
+        # flat if the dashboard is down for a long run. Dashboards
+        # without the batch route flip this flag on the first 404 and
+        # get per-event posts instead.
+        self._batch_supported = True
+        self._progress_buffer = deque(maxlen=64)
+        self._progress_buffer_lock = threading.Lock()
+        self._progress_last_flush = time.monotonic()
+        self._progress_flush_interval = 2.0
+        self._batch_max_size = 16
+
+        # Monotonic time of the last response that proved the dashboard
+        # reachable; gates expensive work on the error path
+        self._last_health_ok = 0.0
+
+        # (checked_at, result) for health_check; callers that gate every
+        # send on health would otherwise double their round trips
+        self._health_cache = (0.0, False)
+
+        # Per-endpoint ETag and parsed body for conditional GETs: a 304
+        # carries no payload, so polled reads cost headers only
+        self._etags = {}
+        self._etag_bodies = {}
+
+        # Advisory traffic (status batches, error reports) goes through a
+        # background sender so the optimizer never stalls on dashboard
+        # I/O; a slow dashboard costs queue space, not pipeline latency.
+        # send_results stays synchronous - it is the report of record.
+        self._tx_queue = queue.Queue(maxsize=256)
+        self._tx_thread = threading.Thread(
+            target=self._tx_worker, daemon=True, name='dashboard-tx')
+        self._tx_thread.start()
+
+        # Headers never change after init - set them on the session once
+        # instead of rebuilding the dict on every request
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': 'NWS-PPC-Optimizer/2.0'
+        })
+        if self.api_key:
+            self.session.headers['Authorization'] = f'Bearer {self.api_key}'
+            self.session.headers['X-API-Key'] = self.api_key
+        if self.profile_id:
+            self.session.headers['X-Profile-ID'] = str(self.profile_id)
+
+        # Every endpoint URL the client ever hits, resolved once; saves
+        # the per-request f-string concat and gives the prepared-request
+        # templates a single source of truth
+        self._urls = {
+            path: f'{self.url}{path}'
+            for path in ('/api/optimization-results',
+                         '/api/optimization-status',
+                         '/api/optimization-status/batch',
+                         '/api/optimization-error',
+                         '/api/health')
+        }
+
+        # Prepared-request skeletons for the hot fire-and-forget
+        # endpoints: Session.request re-runs Request() + prepare() +
+        # header merging per call, but for these only the body changes,
+        # so we prepare once and patch bytes per send
+        self._prepared = {}
+        if self.url:
+            for path in ('/api/optimization-status/batch',
+                         '/api/optimization-error'):
+                self._prepared[path] = self.session.prepare_request(
+                    requests.Request('POST', self._urls[path]))
+
+        # The masked copy for request logging never changes either;
+        # compute it once instead of copy-and-redact per request
+        safe_headers = dict(self.session.headers)
+        if 'Authorization' in safe_headers:
+            safe_headers['Authorization'] = 'Bearer ***REDACTED***'
+        if 'X-API-Key' in safe_headers:
+            safe_headers['X-API-Key'] = 'REDACTED'
+        self._safe_headers_log = safe_headers
+
         if not self.url:
             logger.warning("Dashboard URL not configured")
             self.enabled = False
@@ -97,22 +239,99 @@ class DashboardClient:
         if self.enabled and not self.api_key:
             logger.warning("Dashboard API key not configured - requests may be rejected")
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for dashboard API requests"""
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'NWS-PPC-Optimizer/2.0'
-        }
+    def _tx_worker(self):
+        """Drain queued fire-and-forget requests until the sentinel"""
+        while True:
+            item = self._tx_queue.get()
+            try:
+                if item is None:
+                    return
+                endpoint, payload, method = item
+                if endpoint == '/api/optimization-status/batch':
+                    self._send_status_batch(payload)
+                elif method == 'POST' and endpoint in self._prepared:
+                    self._send_prepared(endpoint, payload)
+                else:
+                    self._make_request(endpoint, payload, method)
+            except Exception as e:  # keep the worker alive
+                logger.error(f"Background dashboard send failed: {str(e)}")
+            finally:
+                self._tx_queue.task_done()
+
+    def _enqueue_tx(self, endpoint: str, payload: Dict, method: str = 'POST') -> bool:
+        """Hand a request to the background sender, dropping the oldest on overflow"""
+        try:
+            self._tx_queue.put_nowait((endpoint, payload, method))
+            return True
+        except queue.Full:
+            try:
+                self._tx_queue.get_nowait()
+                self._tx_queue.task_done()
+                self._tx_queue.put_nowait((endpoint, payload, method))
+                return True
+            except (queue.Empty, queue.Full):
+                logger.warning("Dashboard send queue full - dropping update")
+                return False
+
+    def _send_prepared(self, endpoint: str, payload: Dict) -> Optional[int]:
+        """Send via a prepared-request template, patching only the body
+
+        Returns:
+            The HTTP status code, or None when the send itself failed
+        """
+        if not self.enabled:
+            return None
+        try:
+            req = copy.copy(self._prepared[endpoint])
+            req.headers = req.headers.copy()
+            body = _json_dumps_bytes(payload)
+            if self.compress_payload and len(body) > _GZIP_THRESHOLD_BYTES:
+                body = gzip.compress(body, compresslevel=1)
+                req.headers['Content-Encoding'] = 'gzip'
+            req.body = body
+            req.headers['Content-Length'] = str(len(body))
+
+            response = self.session.send(req, timeout=self.timeout)
+            logger.info(f"Dashboard POST {endpoint}: HTTP {response.status_code}")
+
+            if response.status_code == 200:
+                self._last_health_ok = time.monotonic()
+            else:
+                body_preview = response.text[:1000] if response.text else 'Empty response'
+                logger.warning(f"Dashboard returned {response.status_code}: {body_preview}")
+            return response.status_code
+        except Exception as e:
+            logger.error(f"Dashboard request failed to {endpoint}: {str(e)}")
+            return None
+
+    def _send_status_batch(self, payload: Dict):
+        """POST a status batch, falling back to per-event posts on 404
+
+        Deployed dashboards may predate the batch route; a 404 marks it
+        unsupported for the rest of the process and the batch (plus all
+        later ones) is replayed against /api/optimization-status one
+        event at a time, with the batch-level run_id stamped onto each
+        event since per-event posts carry it inline.
+        """
+        if self._batch_supported:
+            status = self._send_prepared('/api/optimization-status/batch', payload)
+            if status != 404:
+                return
+            self._batch_supported = False
+            logger.info("Dashboard has no batch status endpoint - "
+                        "falling back to per-event status posts")
+
+        run_id = payload.get('run_id')
+        for event in payload.get('events', ()):
+            self._make_request('/api/optimization-status',
+                               {'run_id': run_id, **event})
+
+    def close(self):
+        """Flush buffered progress and stop the background sender"""
+        self.flush_progress()
+        self._tx_queue.put(None)
+        self._tx_thread.join(timeout=self.timeout)
 
-        if self.api_key:
-            headers['Authorization'] = f'Bearer {self.api_key}'
-            headers['X-API-Key'] = self.api_key
-        
-        if self.profile_id:
-            headers['X-Profile-ID'] = str(self.profile_id)
-        
-        return headers
-    
     def _make_request(self, endpoint: str, payload: Dict, method: str = 'POST') -> Optional[Dict]:
         """
         Make HTTP request to dashboard with error handling
@@ -130,27 +349,33 @@ class DashboardClient:
             return None
         
         try:
-            url = f"{self.url}{endpoint}"
-
-            # Log request details (mask API key)
-            safe_headers = self._get_headers()
-            if safe_headers:
-                safe_headers_log = safe_headers.copy()
-                if 'Authorization' in safe_headers_log:
-                    safe_headers_log['Authorization'] = 'Bearer ***REDACTED***'
-                if 'X-API-Key' in safe_headers_log:
-                    safe_headers_log['X-API-Key'] = 'REDACTED'
-            else:
-                safe_headers_log = safe_headers
+            url = self._urls.get(endpoint) or f"{self.url}{endpoint}"
+
             logger.debug(f"Dashboard {method} {url}")
-            logger.debug(f"Request headers: {safe_headers_log}")
+            logger.debug(f"Request headers: {self._safe_headers_log}")
             logger.debug(f"Request payload preview: {str(payload)[:500]}")
             
+            # Pre-encoded bytes via data= skip requests' json= path, which
+            # runs stdlib json.dumps and a UTF-8 re-encode per call; the
+            # session already carries Content-Type: application/json
+            body = _json_dumps_bytes(payload)
+            extra_headers = None
+            if self.compress_payload and len(body) > _GZIP_THRESHOLD_BYTES:
+                # Results payloads embed the whole features dict and can
+                # run to hundreds of KB of repetitive JSON; level 1 gets
+                # most of the wire-size win for negligible CPU
+                body = gzip.compress(body, compresslevel=1)
+                extra_headers = {'Content-Encoding': 'gzip'}
+
+            if method == 'GET' and endpoint in self._etags:
+                extra_headers = dict(extra_headers or ())
+                extra_headers['If-None-Match'] = self._etags[endpoint]
+
             response = self.session.request(
                 method=method,
                 url=url,
-                json=payload,
-                headers=self._get_headers(),
+                data=body,
+                headers=extra_headers,
                 timeout=self.timeout
             )
             
@@ -159,11 +384,23 @@ class DashboardClient:
             logger.debug(f"Response headers: {dict(response.headers)}")
             
             if response.status_code == 200:
-                return response.json() if response.content else {}
+                self._last_health_ok = time.monotonic()
+                parsed = _json_loads(response.content) if response.content else {}
+                if method == 'GET':
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._etags[endpoint] = etag
+                        self._etag_bodies[endpoint] = parsed
+                return parsed
+            elif response.status_code == 304:
+                # Not modified: the server validated our ETag, serve the
+                # body cached from the last full response
+                self._last_health_ok = time.monotonic()
+                return self._etag_bodies.get(endpoint, {})
             elif response.status_code == 429:
+                # Adapter-level Retry already waited out Retry-After;
+                # reaching here means the budget is exhausted
                 logger.warning(f"Dashboard rate limit exceeded: {response.text}")
-                retry_after = response.headers.get('Retry-After', '60')
-                logger.info(f"Retry after {retry_after} seconds")
             else:
                 # Log full response body for non-200 status codes (especially 400 errors)
                 body_preview = response.text[:1000] if response.text else 'Empty response'
@@ -193,21 +430,27 @@ class DashboardClient:
         Returns:
             Unique run ID
         """
-        self.current_run_id = str(uuid.uuid4())
+        from uuid import uuid4
+
+        # Flush leftovers from a previous (possibly crashed) run before
+        # reassigning the id: the batch payload stamps current_run_id at
+        # flush time, so old events must not be attributed to this run
+        self.flush_progress()
+
+        # .hex skips the dash-formatting of str(uuid4) - the dashboard
+        # treats the id as an opaque token either way
+        self.current_run_id = uuid4().hex
         
         if self.send_real_time_updates:
-            payload = {
-                'timestamp': datetime.now().isoformat(),
-                'run_id': self.current_run_id,
+            self._buffer_progress_event({
+                'timestamp': _iso_now(),
                 'status': 'started',
                 'profile_id': self.profile_id,
                 'dry_run': dry_run
-            }
-            self._make_request('/api/optimization-status', payload)
+            })
         
         return self.current_run_id
     
-    @retry_with_backoff(max_attempts=3, initial_delay=2, max_delay=10)
     def send_results(self, results: Dict, config: Dict, duration_seconds: float, 
                     dry_run: bool = False) -> bool:
         """
@@ -227,6 +470,10 @@ class DashboardClient:
             return False
         
         try:
+            # Results mark a phase boundary - push any buffered progress
+            # first so the dashboard timeline stays ordered
+            self.flush_progress()
+
             # Build enhanced payload
             payload = self.build_results_payload(results, config, duration_seconds, dry_run)
             
@@ -259,17 +506,50 @@ class DashboardClient:
         if not self.enabled or not self.send_real_time_updates:
             return False
         
-        payload = {
-            'timestamp': datetime.now().isoformat(),
-            'run_id': self.current_run_id,
+        self._buffer_progress_event({
+            'timestamp': _iso_now(),
             'status': 'running',
             'message': message,
             'percent_complete': percent_complete,
             'profile_id': self.profile_id
-        }
+        })
+        return True
+
+    def _buffer_progress_event(self, event: Dict):
+        """Queue a status event, flushing when the batch fills or goes stale"""
+        with self._progress_buffer_lock:
+            self._progress_buffer.append(event)
+            full = len(self._progress_buffer) >= self._batch_max_size
+            stale = (time.monotonic() - self._progress_last_flush
+                     >= self._progress_flush_interval)
+        if full or stale:
+            self.flush_progress()
+
+    def flush_progress(self) -> bool:
+        """
+        Ship all buffered status events in one batch POST
         
-        response = self._make_request('/api/optimization-status', payload)
-        return response is not None
+        Each progress tick used to cost a full round trip; batching
+        collapses N ticks into one request. Called automatically when
+        the buffer fills or ages out, and explicitly at phase
+        boundaries (send_results / send_error).
+        
+        Returns:
+            True if there was nothing to send or the batch was accepted
+        """
+        with self._progress_buffer_lock:
+            if not self._progress_buffer:
+                return True
+            events = list(self._progress_buffer)
+            self._progress_buffer.clear()
+            self._progress_last_flush = time.monotonic()
+        
+        # Queued, not sent inline: the optimizer thread returns
+        # immediately and the background worker absorbs dashboard latency
+        return self._enqueue_tx(
+            '/api/optimization-status/batch',
+            {'run_id': self.current_run_id, 'events': events}
+        )
     
     def send_error(self, error: Exception, context: Dict = None) -> bool:
         """
@@ -285,29 +565,37 @@ class DashboardClient:
         if not self.enabled:
             return False
         
-        import traceback
-        
+        self.flush_progress()
+
+        # Formatting a traceback walks and renders every frame - wasted
+        # work if the payload is only going to die on an unreachable
+        # dashboard. Format it only when a recent response proved the
+        # dashboard up (or a fresh health check does), and cap the depth:
+        # optimizer stacks can run deep and the first frames carry the
+        # context that matters.
+        trace = ''
+        if time.monotonic() - self._last_health_ok < 60 or self.health_check():
+            trace = ''.join(traceback.format_exception(
+                type(error), error, error.__traceback__, limit=20))
+
         payload = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _iso_now(),
             'run_id': self.current_run_id,
             'status': 'failed',
             'profile_id': self.profile_id,
             'error': {
                 'type': type(error).__name__,
                 'message': str(error),
-                'traceback': traceback.format_exc(),
+                'traceback': trace,
                 'context': context or {}
             }
         }
         
-        response = self._make_request('/api/optimization-error', payload)
-        
-        if response is not None:
-            logger.info("Error reported to dashboard")
+        if self._enqueue_tx('/api/optimization-error', payload):
+            logger.info("Error report queued for dashboard")
             return True
-        else:
-            logger.warning("Failed to report error to dashboard")
-            return False
+        logger.warning("Failed to queue error report for dashboard")
+        return False
     
     def health_check(self) -> bool:
         """
@@ -319,12 +607,20 @@ class DashboardClient:
         if not self.enabled:
             return False
         
+        now = time.monotonic()
+        checked_at, healthy = self._health_cache
+        if now - checked_at < 30:
+            return healthy
+        
         try:
             response = self._make_request('/api/health', {}, method='GET')
-            return response is not None
+            healthy = response is not None
         except Exception as e:
             logger.error(f"Dashboard health check failed: {str(e)}")
-            return False
+            healthy = False
+        
+        self._health_cache = (now, healthy)
+        return healthy
     
     def build_results_payload(self, results: Dict, config: Dict, 
                                duration_seconds: float, dry_run: bool) -> Dict:
@@ -343,8 +639,8 @@ class DashboardClient:
         Returns:
             Enhanced payload dictionary
         """
-        # Extract summary metrics from results
-        summary = self._extract_summary(results)
+        # Summary metrics, errors, and warnings come out of one pass
+        summary, errors, warnings = self._collect(results)
         
         # Build campaigns list
         campaigns = self._extract_campaigns(results)
@@ -352,46 +648,40 @@ class DashboardClient:
         # Extract top performers
         top_performers = self._extract_top_performers(results)
         
-        # Collect errors and warnings
-        errors = self._extract_errors(results)
-        warnings = self._extract_warnings(results)
-        
-        payload = {
-            'timestamp': datetime.now().isoformat(),
-            'run_id': self.current_run_id or str(uuid.uuid4()),
-            'status': 'success',
-            'profile_id': self.profile_id,
-            'dry_run': dry_run,
-            'duration_seconds': duration_seconds,
-            
-            # Summary metrics
-            'summary': summary,
-            
-            # Detailed results by feature
-            'features': results,
-            
-            # Campaign-level breakdown
-            'campaigns': campaigns,
-            
-            # Top performing keywords
-            'top_performers': top_performers,
-            
-            # Errors and warnings
-            'errors': errors,
-            'warnings': warnings,
-            
-            # Configuration snapshot
-            'config_snapshot': {
-                'target_acos': config.get('bid_optimization', {}).get('target_acos'),
-                'lookback_days': config.get('bid_optimization', {}).get('lookback_days'),
-                'enabled_features': config.get('features', {}).get('enabled', [])
-            }
+        # Generate (and keep) a run id only if start_run never assigned
+        # one, so later sends reuse it instead of minting a fresh uuid
+        if self.current_run_id is None:
+            from uuid import uuid4
+            self.current_run_id = uuid4().hex
+
+        payload = self._PAYLOAD_TEMPLATE.copy()
+        payload['timestamp'] = _iso_now()
+        payload['run_id'] = self.current_run_id
+        payload['profile_id'] = self.profile_id
+        payload['dry_run'] = dry_run
+        payload['duration_seconds'] = duration_seconds
+        payload['summary'] = summary
+        # Detailed results by feature
+        payload['features'] = results
+        payload['campaigns'] = campaigns
+        payload['top_performers'] = top_performers
+        payload['errors'] = errors
+        payload['warnings'] = warnings
+        payload['config_snapshot'] = {
+            'target_acos': config.get('bid_optimization', {}).get('target_acos'),
+            'lookback_days': config.get('bid_optimization', {}).get('lookback_days'),
+            'enabled_features': config.get('features', {}).get('enabled', [])
         }
         
         return payload
     
-    def _extract_summary(self, results: Dict) -> Dict:
-        """Extract summary metrics from results"""
+    def _collect(self, results: Dict) -> tuple:
+        """Gather summary metrics, errors, and warnings in one traversal
+
+        The old _extract_summary/_extract_errors/_extract_warnings trio
+        walked results.items() three times; each feature dict is now
+        touched once, with its .get pre-bound for the repeated lookups.
+        """
         summary = {
             'campaigns_analyzed': 0,
             'campaigns_with_metrics': 0,
@@ -404,61 +694,77 @@ class DashboardClient:
             'total_sales': 0.0,
             'average_acos': 0.0
         }
+        errors = []
+        warnings = []
 
         total_spend = 0.0
         total_sales = 0.0
 
-        # Extract from bid_optimization
-        if 'bid_optimization' in results:
-            bid_data = results['bid_optimization']
-            summary['bids_increased'] += bid_data.get('bids_increased', 0)
-            summary['bids_decreased'] += bid_data.get('bids_decreased', 0)
-            summary['keywords_optimized'] += bid_data.get(
-                'keywords_optimized',
-                bid_data.get('bids_increased', 0) + bid_data.get('bids_decreased', 0)
-            )
-            total_spend += bid_data.get('total_spend', 0.0)
-            total_sales += bid_data.get('total_sales', 0.0)
-
-        # Extract from negative_keywords
-        if 'negative_keywords' in results:
-            neg_data = results['negative_keywords']
-            summary['negative_keywords_added'] += neg_data.get(
-                'negative_keywords_added',
-                neg_data.get('keywords_added', 0)
-            )
+        for feature, data in results.items():
+            # EAFP beats isinstance here: feature values are dicts in the
+            # overwhelmingly common case, so binding .get and letting the
+            # rare non-dict raise skips a PyObject_IsInstance call per
+            # entry
+            try:
+                get = data.get
+            except AttributeError:
+                continue
+
+            try:
+                errors.extend(data['errors'])
+            except (KeyError, TypeError):
+                pass
+            try:
+                warnings.extend(data['warnings'])
+            except (KeyError, TypeError):
+                pass
 
-        # Extract from campaign_management
-        if 'campaign_management' in results:
-            camp_data = results['campaign_management']
-            campaigns_analyzed = camp_data.get('campaigns_analyzed')
-            if campaigns_analyzed is None:
-                campaigns_analyzed = (
-                    camp_data.get('campaigns_paused', 0)
-                    + camp_data.get('campaigns_activated', 0)
-                    + camp_data.get('no_change', 0)
+            if feature == 'bid_optimization':
+                summary['bids_increased'] += get('bids_increased', 0)
+                summary['bids_decreased'] += get('bids_decreased', 0)
+                summary['keywords_optimized'] += get(
+                    'keywords_optimized',
+                    get('bids_increased', 0) + get('bids_decreased', 0)
                 )
-            summary['campaigns_analyzed'] += campaigns_analyzed
-            campaigns_with_metrics = camp_data.get('campaigns_with_metrics')
-            if campaigns_with_metrics is not None:
-                summary['campaigns_with_metrics'] += campaigns_with_metrics
-            else:
-                summary['campaigns_with_metrics'] += campaigns_analyzed
-            summary['budget_changes'] += camp_data.get(
-                'budget_changes',
-                camp_data.get('campaigns_paused', 0) + camp_data.get('campaigns_activated', 0)
-            )
-            total_spend += camp_data.get('total_spend', 0.0)
-            total_sales += camp_data.get('total_sales', 0.0)
-            # If module already calculated ACOS, prefer that value
-            pass  # Removed logic that overwrites average_acos; always use aggregate calculation
+                total_spend += get('total_spend', 0.0)
+                total_sales += get('total_sales', 0.0)
+
+            elif feature == 'negative_keywords':
+                summary['negative_keywords_added'] += get(
+                    'negative_keywords_added',
+                    get('keywords_added', 0)
+                )
+
+            elif feature == 'campaign_management':
+                campaigns_analyzed = get('campaigns_analyzed')
+                if campaigns_analyzed is None:
+                    campaigns_analyzed = (
+                        get('campaigns_paused', 0)
+                        + get('campaigns_activated', 0)
+                        + get('no_change', 0)
+                    )
+                summary['campaigns_analyzed'] += campaigns_analyzed
+                campaigns_with_metrics = get('campaigns_with_metrics')
+                if campaigns_with_metrics is not None:
+                    summary['campaigns_with_metrics'] += campaigns_with_metrics
+                else:
+                    summary['campaigns_with_metrics'] += campaigns_analyzed
+                summary['budget_changes'] += get(
+                    'budget_changes',
+                    get('campaigns_paused', 0) + get('campaigns_activated', 0)
+                )
+                total_spend += get('total_spend', 0.0)
+                total_sales += get('total_sales', 0.0)
+                # Always use the aggregate ACOS calculation below rather
+                # than any per-module value
+
         # Populate totals and derived averages
         summary['total_spend'] = total_spend
         summary['total_sales'] = total_sales
         if total_sales > 0:
             summary['average_acos'] = total_spend / total_sales
 
-        return summary
+        return summary, errors, warnings
     
     def _extract_campaigns(self, results: Dict) -> List[Dict]:
         """Extract campaign-level data from results"""
@@ -478,26 +784,6 @@ class DashboardClient:
         
         return top_performers
     
-    def _extract_errors(self, results: Dict) -> List[str]:
-        """Extract error messages from results"""
-        errors = []
-        
-        for feature, data in results.items():
-            if isinstance(data, dict) and 'errors' in data:
-                errors.extend(data['errors'])
-        
-        return errors
-    
-    def _extract_warnings(self, results: Dict) -> List[str]:
-        """Extract warning messages from results"""
-        warnings = []
-        
-        for feature, data in results.items():
-            if isinstance(data, dict) and 'warnings' in data:
-                warnings.extend(data['warnings'])
-        
-        return warnings
-    
     def _handle_dashboard_response(self, response: Dict):
         """
         Handle response from dashboard API
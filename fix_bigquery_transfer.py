@@ -31,6 +31,32 @@ from google.api_core import exceptions
 from google.cloud import bigquery_datatransfer
 from google.protobuf import field_mask_pb2, struct_pb2
 
+# str.isdigit() accepts Unicode digits (e.g. Arabic-Indic) that the
+# Transfer API rejects server-side, wasting a failed round trip; the API
+# wants ASCII 0-9 only.
+_DIGITS = re.compile(r"[0-9]+")
+
+# Process-wide Data Transfer client.  Each construction opens a fresh gRPC
+# channel (HTTP/2 + TLS handshake); callers that fix several configs in a
+# loop should pay that once.
+_CLIENT: Optional[bigquery_datatransfer.DataTransferServiceClient] = None
+
+
+def _get_client() -> bigquery_datatransfer.DataTransferServiceClient:
+    """Return the shared ``DataTransferServiceClient``, creating it lazily."""
+
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = bigquery_datatransfer.DataTransferServiceClient()
+    return _CLIENT
+
+
+def close_client() -> None:
+    """Drop the shared client so the next call builds a fresh channel."""
+
+    global _CLIENT
+    _CLIENT = None
+
 
 def _ensure_numeric(value: str, *, field_name: str) -> str:
     """Validate that ``value`` contains only decimal digits.
@@ -58,10 +84,10 @@ def _ensure_numeric(value: str, *, field_name: str) -> str:
         raise ValueError(f"{field_name} is required and cannot be blank")
 
     normalized = value.strip()
-    if normalized.isdigit():
+    if _DIGITS.fullmatch(normalized):
         return normalized
 
-    digits_only = re.sub(r"\D", "", normalized)
+    digits_only = re.sub(r"[^0-9]", "", normalized)
     if digits_only:
         logging.warning(
             "%s contained non-digit characters; using normalized numeric value %s",
@@ -80,6 +106,7 @@ def update_transfer_organization_id(
     config_id: str,
     organization_id: str,
     dry_run: bool = False,
+    skip_preflight: bool = False,
 ) -> Optional[str]:
     """Update the ``organization_id`` parameter on a transfer config.
 
@@ -90,9 +117,15 @@ def update_transfer_organization_id(
         organization_id: Numeric organization ID to apply.
         dry_run: When ``True``, log the proposed change without
             performing the update.
+        skip_preflight: When ``True``, skip the ``get_transfer_config``
+            read and send a single update scoped by field mask.  Use
+            when the current value has already been checked elsewhere -
+            it halves the API round trips, but the previous value
+            cannot be reported.
 
     Returns:
-        The previous organization ID if the configuration existed.
+        The previous organization ID if the configuration existed, or
+        ``None`` when ``skip_preflight`` is set.
 
     Raises:
         google.api_core.exceptions.GoogleAPICallError: Propagates API
@@ -103,26 +136,53 @@ def update_transfer_organization_id(
         organization_id, field_name="organization_id"
     )
 
-    client = bigquery_datatransfer.DataTransferServiceClient()
+    client = _get_client()
     transfer_name = client.transfer_config_path(
         project=project_id, location=location, transfer_config=config_id
     )
 
+    if skip_preflight:
+        # The field mask scopes the write to params.organization_id, so a
+        # sparse config is safe: the server merges rather than replacing
+        # the whole params struct.
+        if dry_run:
+            logging.info(
+                "Dry run enabled; would set organization_id to %s on %s",
+                validated_org_id,
+                transfer_name,
+            )
+            return None
+        sparse_config = bigquery_datatransfer.TransferConfig(
+            name=transfer_name,
+            params=struct_pb2.Struct(
+                fields={
+                    "organization_id": struct_pb2.Value(
+                        string_value=validated_org_id
+                    )
+                }
+            ),
+        )
+        update_mask = field_mask_pb2.FieldMask(paths=["params.organization_id"])
+        client.update_transfer_config(
+            transfer_config=sparse_config, update_mask=update_mask
+        )
+        logging.info("Transfer configuration updated successfully")
+        return None
+
     logging.info("Fetching transfer configuration: %s", transfer_name)
     config = client.get_transfer_config(name=transfer_name)
 
-    params_struct = struct_pb2.Struct()
-    if config.params:
-        params_struct.update(config.params)
-
-    previous_org_id = params_struct.get("organization_id")
+    # Read and mutate config.params directly: the old Struct copy
+    # round-trip (update + CopyFrom) deep-copied every param - Google Ads
+    # configs carry many - just to touch one key.
+    previous_org_id = config.params.get("organization_id") if config.params else None
     previous_org_id_str = None
     if previous_org_id is not None:
         # ``Struct`` values may be stored as numbers or strings depending on how
         # the transfer configuration was created.  Normalize to a string so we
         # compare apples-to-apples and avoid sending no-op updates.
         previous_org_id_str = str(previous_org_id).strip()
-        if previous_org_id_str and not previous_org_id_str.isdigit():
+        if previous_org_id_str and not _DIGITS.fullmatch(previous_org_id_str):
             logging.warning(
                 "Existing organization_id value %r is not numeric; it will be overwritten",
                 previous_org_id,
@@ -138,13 +198,11 @@ def update_transfer_organization_id(
     logging.info(
         "Updating organization_id from %r to %s", previous_org_id, validated_org_id
     )
-    params_struct["organization_id"] = validated_org_id
-
     if dry_run:
         logging.info("Dry run enabled; skipping API update call")
         return previous_org_id_str
 
-    config.params.CopyFrom(params_struct)
+    config.params["organization_id"] = validated_org_id
     update_mask = field_mask_pb2.FieldMask(paths=["params.organization_id"])
     client.update_transfer_config(transfer_config=config, update_mask=update_mask)
     logging.info("Transfer configuration updated successfully")
@@ -169,6 +227,14 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         required=True,
         help="Numeric organization ID expected by the data source",
     )
+    parser.add_argument(
+        "--skip-preflight",
+        action="store_true",
+        help=(
+            "Skip the read of the current config and issue a single "
+            "field-masked update (previous value will not be reported)"
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -194,6 +260,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             config_id=args.config_id,
             organization_id=args.organization_id,
             dry_run=args.dry_run,
+            skip_preflight=args.skip_preflight,
         )
     except ValueError as exc:
         logging.error("Validation failed: %s", exc)
@@ -202,7 +269,9 @@ def main(argv: Optional[list[str]] = None) -> int:
         logging.error("BigQuery Data Transfer API error: %s", exc)
         return 1
 
-    if previous_value is None:
+    if args.skip_preflight:
+        pass
+    elif previous_value is None:
         logging.info("organization_id was not previously set")
     else:
         logging.info("Previous organization_id value was %s", previous_value)
@@ -0,0 +1,500 @@
+"""
+GitHub Pages Dashboard Module
+==============================
+
+Publishes optimization results to the static GitHub Pages dashboard by
+committing a JSON data file through the GitHub contents API.
+
+This module:
+- Keeps a rolling 30-run history in data/ppc-data.json
+- Recomputes aggregate statistics on every update
+- Records verification status from post-run checks
+
+Author: Nature's Way Soil
+Version: 1.0.0
+"""
+
+import base64
+import concurrent.futures
+import copy
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Runs retained in the dashboard history
+_MAX_RUNS = 30
+
+
+@dataclass(slots=True)
+class RunSummary:
+    """Typed view of the optimizer's summary block
+
+    Slots make attribute reads a fixed-offset load instead of a dict
+    hash per field, and give every metric a default so a sparse summary
+    still formats cleanly.
+    """
+
+    campaigns_analyzed: int = 0
+    keywords_optimized: int = 0
+    bids_increased: int = 0
+    bids_decreased: int = 0
+    negative_keywords_added: int = 0
+    total_spend: float = 0.0
+    total_sales: float = 0.0
+    average_acos: float = 0.0
+
+    _FIELD_NAMES = ()
+
+    @classmethod
+    def from_dict(cls, summary: Dict) -> 'RunSummary':
+        """Build a RunSummary, ignoring keys the dashboard doesn't use"""
+        return cls(**{k: summary[k] for k in cls._FIELD_NAMES if k in summary})
+
+
+RunSummary._FIELD_NAMES = tuple(f.name for f in fields(RunSummary))
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available.
+
+    orjson formats straight to UTF-8 bytes in C, so the dashboard file
+    (30 runs of nested feature data) skips the stdlib encoder and the
+    extra str-to-bytes pass before base64. Compact output (no indent,
+    no separator padding) cuts the file - and the base64 PUT body built
+    from it - by roughly a third; the page's JS consumes it with
+    fetch().json() and never reads it by eye.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False,
+                      default=str).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+class GitHubPagesDashboard:
+    """
+    Publishes optimization data to the GitHub Pages dashboard
+
+    Features:
+    - Rolling 30-run history committed to data/ppc-data.json
+    - Aggregate statistics across the retained history
+    - Verification status reporting
+    """
+
+    def __init__(self, github_token: Optional[str] = None,
+                 repo_owner: str = 'natureswaysoil',
+                 repo_name: str = 'Amazom-PPC',
+                 branch: str = 'main',
+                 data_path: str = 'data/ppc-data.json',
+                 cache_path: Optional[str] = None):
+        """
+        Initialize the dashboard publisher
+
+        Args:
+            github_token: GitHub API token (defaults to GITHUB_TOKEN env var)
+            repo_owner: Repository owner
+            repo_name: Repository name
+            branch: Branch the data file lives on
+            data_path: Path of the JSON data file within the repository
+            cache_path: Local file memoizing the last published state
+                (defaults to ppc-dashboard-cache.json in the temp dir)
+        """
+        self.github_token = github_token or os.environ.get('GITHUB_TOKEN', '')
+        self.repo_owner = repo_owner
+        self.repo_name = repo_name
+        self.branch = branch
+        self.data_path = data_path
+        self.enabled = bool(self.github_token)
+
+        # This process is the only writer of the data file, so the last
+        # successful upload (payload + returned SHA) doubles as the
+        # current remote state. Publishing from this local cache skips
+        # the contents GET entirely on the warm path; a failed PUT falls
+        # back to a fresh read.
+        self.cache_path = cache_path or os.path.join(
+            tempfile.gettempdir(), 'ppc-dashboard-cache.json')
+
+        # Last ETag and parsed (data, sha) from the contents endpoint;
+        # a validated 304 skips the base64 + JSON decode of the whole
+        # history blob and doesn't count against the rate limit
+        self._etag: Optional[str] = None
+        self._etag_state: Optional[tuple] = None
+
+        # Staged changes awaiting flush(); deferring lets a run update
+        # and its verification status land as one commit and one PUT
+        self.pending_updates: Dict = {}
+
+        # Overlaps the cold-path SHA lookup with payload serialization
+        # in _upload_to_github; two workers so a straggling request
+        # can't block the next upload's lookup
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        self.contents_url = (
+            f"https://api.github.com/repos/{repo_owner}/{repo_name}"
+            f"/contents/{data_path}"
+        )
+
+        # One keep-alive session for all GitHub API traffic: a single
+        # update is 3+ sequential calls to api.github.com, and each cold
+        # TLS handshake there costs ~100-400 ms. Transient 5xx retries
+        # happen in the transport (GET and PUT are both safe here - the
+        # PUT carries a SHA, so a replay can't clobber a newer commit).
+        self.session = requests.Session()
+        self.session.headers.update(self._get_headers())
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=['GET', 'PUT'],
+            ),
+        ))
+
+        if not self.enabled:
+            logger.warning("GitHub token not configured - dashboard publishing disabled")
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get headers for GitHub API requests"""
+        return {
+            'Authorization': f'token {self.github_token}',
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'NWS-PPC-Optimizer/2.0'
+        }
+
+    def _get_file_sha(self) -> Optional[str]:
+        """Fetch the current blob SHA of the data file, if it exists"""
+        try:
+            response = self.session.get(
+                self.contents_url,
+                params={'ref': self.branch},
+                timeout=30,
+            )
+            if response.status_code == 200:
+                return response.json().get('sha')
+            return None
+        except requests.RequestException as e:
+            logger.warning(f"Could not fetch file SHA: {e}")
+            return None
+
+    def _read_cache(self) -> Optional[tuple]:
+        """Load (data, sha) from the last successful upload, if present"""
+        try:
+            with open(self.cache_path, 'rb') as fh:
+                cached = _json_loads(fh.read())
+            return cached['data'], cached['sha']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cache(self, data: Dict, sha: Optional[str]) -> None:
+        """Persist the published state atomically for the next update"""
+        try:
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'wb') as fh:
+                fh.write(_json_dumps({'data': data, 'sha': sha}))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write dashboard cache: {e}")
+
+    def _load_state(self) -> tuple:
+        """Current dashboard state as (data, sha, from_cache)"""
+        cached = self._read_cache()
+        if cached is not None:
+            return cached[0], cached[1], True
+        data, sha = self._get_current_data()
+        return data, sha, False
+
+    def _get_current_data(self) -> tuple:
+        """Fetch and decode the current dashboard data file
+
+        Returns:
+            (data, sha) - the same contents response carries the blob
+            SHA the subsequent PUT needs, so callers pass it along
+            instead of paying a second GET on the same endpoint
+        """
+        try:
+            headers = {'If-None-Match': self._etag} if self._etag else None
+            response = self.session.get(
+                self.contents_url,
+                params={'ref': self.branch},
+                headers=headers,
+                timeout=30,
+            )
+            if response.status_code == 304 and self._etag_state is not None:
+                # Not modified: reuse the last parsed state. Deep-copied
+                # because callers mutate the dict before uploading.
+                data, sha = self._etag_state
+                return copy.deepcopy(data), sha
+            if response.status_code == 200:
+                payload = response.json()
+                # orjson parses the decoded bytes directly - no
+                # intermediate UTF-8 str of the whole history blob
+                data = _json_loads(base64.b64decode(payload['content']))
+                sha = payload.get('sha')
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._etag = etag
+                    self._etag_state = (copy.deepcopy(data), sha)
+                return data, sha
+            if response.status_code != 404:
+                logger.warning(f"GitHub contents GET returned {response.status_code}")
+        except (requests.RequestException, ValueError, KeyError) as e:
+            logger.warning(f"Could not fetch current dashboard data: {e}")
+
+        return {'last_updated': None, 'runs': [], 'statistics': {}}, None
+
+    def _upload_to_github(self, data: Dict, message: str,
+                          sha: Optional[str] = None) -> bool:
+        """Serialize and commit the dashboard data file
+
+        Args:
+            data: Dashboard data to serialize
+            message: Commit message
+            sha: Blob SHA from an earlier contents GET; fetched only
+                when the caller doesn't already have it
+        """
+        try:
+            # Cold path (no SHA from the cache or an earlier GET): start
+            # the contents lookup on the executor so its round trip runs
+            # under the serialize + base64 work instead of after it
+            sha_future = None
+            if sha is None:
+                sha_future = self._executor.submit(self._get_file_sha)
+
+            json_bytes = _json_dumps(data)
+            payload = {
+                'message': message,
+                'content': base64.b64encode(json_bytes).decode('ascii'),
+                'branch': self.branch,
+            }
+
+            if sha_future is not None:
+                sha = sha_future.result(timeout=10)
+            if sha:
+                payload['sha'] = sha
+
+            response = self.session.put(
+                self.contents_url,
+                json=payload,
+                timeout=30,
+            )
+
+            if response.status_code in (200, 201):
+                logger.info(f"Dashboard data committed: {message}")
+                try:
+                    new_sha = response.json().get('content', {}).get('sha')
+                except ValueError:
+                    new_sha = None
+                self._write_cache(data, new_sha)
+                return True
+
+            logger.error(f"GitHub upload failed: HTTP {response.status_code}: "
+                         f"{response.text[:500]}")
+            return False
+
+        except requests.RequestException as e:
+            logger.error(f"GitHub upload failed: {e}")
+            return False
+
+    def update_dashboard(self, optimization_results: Dict,
+                         defer: bool = False) -> bool:
+        """
+        Add an optimization run to the dashboard history and publish
+
+        Args:
+            optimization_results: Results payload from the optimizer
+            defer: Stage the update for a later flush() instead of
+                committing immediately - lets the verification status
+                ride along in the same commit
+
+        Returns:
+            True if the dashboard was updated (or staged)
+        """
+        if not self.enabled:
+            return False
+
+        self.pending_updates['run'] = self._format_optimization_data(
+            optimization_results)
+        if defer:
+            return True
+        return self.flush()
+
+    def _apply_run(self, current_data: Dict, new_entry: Dict) -> None:
+        """Merge a new run entry into the dashboard state in place
+
+        History is stored oldest-first: append is amortized O(1) and the
+        del-slice trims in place, where the old insert(0) shifted every
+        retained entry and the [:30] slice copied the list. The newest
+        run is always available via the separate 'latest' key.
+        """
+        runs = current_data.setdefault('runs', [])
+        runs.append(new_entry)
+        del runs[:-_MAX_RUNS]
+
+        current_data['last_updated'] = datetime.now().isoformat()
+        current_data['latest'] = new_entry
+        current_data['statistics'] = self._calculate_statistics(current_data['runs'])
+
+    def send_verification_status(self, verified: bool,
+                                 details: Optional[Dict] = None,
+                                 defer: bool = False) -> bool:
+        """
+        Record the result of post-run verification on the dashboard
+
+        Args:
+            verified: Whether verification passed
+            details: Optional verification details
+            defer: Stage the status for a later flush() instead of
+                committing immediately
+
+        Returns:
+            True if the status was published (or staged)
+        """
+        if not self.enabled:
+            return False
+
+        self.pending_updates['verification'] = {
+            'verified': verified,
+            'timestamp': datetime.now().isoformat(),
+            'details': details or {},
+        }
+        if defer:
+            return True
+        return self.flush()
+
+    def flush(self) -> bool:
+        """
+        Commit all staged changes in a single PUT
+
+        A run update and its verification staged with defer=True land
+        as one commit instead of two full GET+PUT cycles, and the
+        history stays one commit per run.
+
+        Returns:
+            True if there was nothing to flush or the commit succeeded
+        """
+        if not self.pending_updates:
+            return True
+
+        current_data, sha, from_cache = self._load_state()
+        self._apply_pending(current_data)
+        message = self._pending_message()
+
+        if self._upload_to_github(current_data, message, sha=sha):
+            self.pending_updates = {}
+            return True
+
+        if from_cache:
+            # The cached SHA can go stale if anything else touched the
+            # file (GitHub answers 409/422); re-read and retry once
+            current_data, sha = self._get_current_data()
+            self._apply_pending(current_data)
+            if self._upload_to_github(current_data, message, sha=sha):
+                self.pending_updates = {}
+                return True
+        return False
+
+    def _apply_pending(self, current_data: Dict) -> None:
+        """Merge every staged change into the dashboard state"""
+        run_entry = self.pending_updates.get('run')
+        if run_entry is not None:
+            self._apply_run(current_data, run_entry)
+        verification = self.pending_updates.get('verification')
+        if verification is not None:
+            current_data['verification'] = verification
+
+    def _pending_message(self) -> str:
+        """Commit message describing the staged changes"""
+        parts = []
+        run_entry = self.pending_updates.get('run')
+        if run_entry is not None:
+            parts.append(
+                f"Update dashboard data for run {run_entry.get('run_id', 'unknown')}")
+        verification = self.pending_updates.get('verification')
+        if verification is not None:
+            status = 'passed' if verification['verified'] else 'failed'
+            parts.append(f"verification {status}")
+        return '; '.join(parts) or 'Update dashboard data'
+
+    def _format_optimization_data(self, results: Dict) -> Dict:
+        """Shape raw optimizer results into a dashboard history entry"""
+        summary = RunSummary.from_dict(results.get('summary', {}))
+
+        return {
+            'run_id': results.get('run_id'),
+            'timestamp': results.get('timestamp') or datetime.now().isoformat(),
+            'status': results.get('status', 'success'),
+            'dry_run': results.get('dry_run', False),
+            'duration_seconds': results.get('duration_seconds', 0.0),
+            'metrics': {
+                'campaigns_analyzed': summary.campaigns_analyzed,
+                'keywords_optimized': summary.keywords_optimized,
+                'bids_increased': summary.bids_increased,
+                'bids_decreased': summary.bids_decreased,
+                'negative_keywords_added': summary.negative_keywords_added,
+                'total_spend': round(summary.total_spend, 2),
+                'total_sales': round(summary.total_sales, 2),
+                'average_acos': round(summary.average_acos, 4),
+            },
+            'errors': results.get('errors', []),
+            'warnings': results.get('warnings', []),
+        }
+
+    def _calculate_statistics(self, runs: List[Dict]) -> Dict:
+        """Aggregate statistics across the retained run history"""
+        # Accumulate in locals (fast LOAD/STORE_FAST) and bind each
+        # metrics dict's .get once, instead of hashing into the stats
+        # dict four times per run. Money is summed as integer cents -
+        # exact int adds, no drift from 30 float additions - and only
+        # converted back to dollars in the final dict
+        successful = 0
+        total_campaigns = 0
+        total_keywords = 0
+        spend_cents = 0
+        sales_cents = 0
+
+        for run in runs:
+            if run.get('status') != 'success':
+                continue
+            successful += 1
+            get = run.get('metrics', {}).get
+            total_campaigns += get('campaigns_analyzed', 0)
+            total_keywords += get('keywords_optimized', 0)
+            spend_cents += int(round(get('total_spend', 0.0) * 100))
+            sales_cents += int(round(get('total_sales', 0.0) * 100))
+
+        return {
+            'total_runs': len(runs),
+            'successful_runs': successful,
+            'total_campaigns_analyzed': total_campaigns,
+            'total_keywords_optimized': total_keywords,
+            'total_spend': spend_cents / 100,
+            'total_sales': sales_cents / 100,
+            'average_acos': round(spend_cents / sales_cents, 4) if sales_cents > 0 else 0.0,
+        }
@@ -16,11 +16,19 @@ Usage:
 """
 
 import os
+import random
+import re
 import sys
 import time
 import csv
 from typing import Optional, Dict, List
-from io import StringIO
+from io import TextIOWrapper
+
+# One compiled pattern replaces the chain of substring scans in
+# validate_url_format, and unlike the old '/export?format=csv' check it
+# matches export URLs where format=csv isn't the first query parameter
+_CSV_EXPORT_RE = re.compile(
+    r'docs\.google\.com/spreadsheets/d/[^/]+/export\?.*format=csv', re.I)
 
 try:
     import requests
@@ -52,10 +60,25 @@ class GoogleSheetFetcher:
         self.max_retries = max_retries
         self.timeout = timeout
         self.retry_delay = retry_delay
+
+        # Reuse one keep-alive connection across retries - each attempt
+        # otherwise pays a fresh TCP+TLS handshake to docs.google.com
+        self.session = requests.Session()
         
         if not self.csv_url:
             raise ValueError("CSV_URL must be provided or set as environment variable")
     
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Delay before the next retry: exponential with decorrelating jitter.
+        
+        Doubling uses a shift on the integer base instead of the generic
+        ** operator, and the random slice keeps concurrent jobs retrying
+        against the same sheet from forming a thundering herd.
+        """
+        base = min(self.retry_delay << (attempt - 1), 60)
+        return base + random.uniform(0, base * 0.25)
+    
     def validate_url_format(self) -> bool:
         """
         Validate that the URL is in correct CSV export format.
@@ -67,7 +90,7 @@ class GoogleSheetFetcher:
             return False
         
         # Check for CSV export format
-        if '/export?format=csv' in self.csv_url:
+        if _CSV_EXPORT_RE.search(self.csv_url):
             return True
         
         # Warn about common incorrect formats
@@ -94,7 +117,7 @@ class GoogleSheetFetcher:
             try:
                 print(f"Attempting to fetch Google Sheet (attempt {attempt}/{self.max_retries})...")
                 
-                response = requests.get(
+                response = self.session.get(
                     self.csv_url,
                     timeout=self.timeout,
                     allow_redirects=True,
@@ -107,18 +130,24 @@ class GoogleSheetFetcher:
                 # Check content type
                 content_type = response.headers.get('content-type', '').lower()
                 
-                # If we got HTML, it's an error page
-                if 'text/html' in content_type or response.text.strip().startswith('<!DOCTYPE html>'):
+                # If we got HTML, it's an error page. Sniff the first raw
+                # bytes rather than response.text, which would UTF-8
+                # decode the entire body just to inspect its start
+                if ('text/html' in content_type
+                        or response.content[:256].lstrip().startswith(b'<!DOCTYPE html>')):
                     self._handle_html_response(response, attempt)
-                    if attempt < self.max_retries:
-                        time.sleep(self.retry_delay ** attempt)
-                        continue
-                    return None
+                    if attempt >= self.max_retries:
+                        return None
+                    # Fall through to the shared backoff below; the old
+                    # inner sleep-and-continue made one failed attempt
+                    # wait through two backoff periods
                 
                 # Check HTTP status
-                if response.status_code == 200:
-                    print(f"✓ Successfully fetched CSV data ({len(response.text)} bytes)")
-                    return response.text
+                elif response.status_code == 200:
+                    # Decode exactly once, on the confirmed-CSV path
+                    csv_text = response.content.decode('utf-8')
+                    print(f"✓ Successfully fetched CSV data ({len(response.content)} bytes)")
+                    return csv_text
                 elif response.status_code == 403:
                     print(f"ERROR: HTTP 403 - Permission denied", file=sys.stderr)
                     print("The sheet may be private. Check permissions.", file=sys.stderr)
@@ -139,8 +168,8 @@ class GoogleSheetFetcher:
             
             # Exponential backoff for retries
             if attempt < self.max_retries:
-                wait_time = self.retry_delay ** attempt
-                print(f"Retrying in {wait_time} seconds...")
+                wait_time = self._backoff_delay(attempt)
+                print(f"Retrying in {wait_time:.1f} seconds...")
                 time.sleep(wait_time)
         
         print("FATAL: All retry attempts exhausted", file=sys.stderr)
@@ -161,23 +190,125 @@ class GoogleSheetFetcher:
         
         print(f"Response preview: {response.text[:500]}", file=sys.stderr)
     
+    def fetch_stream(self) -> Optional[csv.DictReader]:
+        """
+        Fetch the sheet and parse rows as they stream in.
+        
+        Unlike fetch(), the response body is never materialized as one
+        big string - rows are decoded chunk by chunk straight off the
+        wire, so peak memory stays at one row instead of the whole
+        sheet (twice, counting the parsed copy).
+        
+        Returns:
+            csv.DictReader yielding one dict per row, or None if failed
+        """
+        if not self.validate_url_format():
+            print("WARNING: Proceeding with potentially incorrect URL format", file=sys.stderr)
+        
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                print(f"Attempting to stream Google Sheet (attempt {attempt}/{self.max_retries})...")
+                
+                response = self.session.get(
+                    self.csv_url,
+                    timeout=self.timeout,
+                    allow_redirects=True,
+                    stream=True,
+                    headers={
+                        'User-Agent': 'Cloud-Run-Job/1.0',
+                        'Accept': 'text/csv,text/plain'
+                    }
+                )
+                
+                content_type = response.headers.get('content-type', '').lower()
+                
+                if response.status_code == 200 and 'text/html' not in content_type:
+                    print("✓ Streaming CSV data")
+                    # Wrap the raw socket file, not iter_lines():
+                    # iter_lines strips line terminators, which corrupts
+                    # quoted cells containing newlines. newline='' hands
+                    # terminators through untouched so the csv module
+                    # does its own (quote-aware) line splitting.
+                    response.raw.decode_content = True
+                    return csv.DictReader(
+                        TextIOWrapper(response.raw, encoding='utf-8', newline='')
+                    )
+                
+                if 'text/html' in content_type:
+                    self._handle_html_response(response, attempt)
+                elif response.status_code in (403, 404):
+                    print(f"ERROR: HTTP {response.status_code}", file=sys.stderr)
+                    return None  # Don't retry permission errors or 404s
+                else:
+                    print(f"ERROR: HTTP {response.status_code}: {response.reason}", file=sys.stderr)
+                
+            except requests.Timeout:
+                print(f"ERROR: Request timeout after {self.timeout}s", file=sys.stderr)
+            except requests.RequestException as e:
+                print(f"ERROR: Request failed: {e}", file=sys.stderr)
+            
+            if attempt < self.max_retries:
+                wait_time = self._backoff_delay(attempt)
+                print(f"Retrying in {wait_time:.1f} seconds...")
+                time.sleep(wait_time)
+        
+        print("FATAL: All retry attempts exhausted", file=sys.stderr)
+        return None
+    
+    def fetch_as_arrow_table(self):
+        """
+        Fetch and parse the sheet with pyarrow's vectorized CSV reader.
+        
+        pyarrow parses CSV in C++ into columnar arrays at a rate that
+        dwarfs csv.DictReader's per-row Python dicts - use this for
+        large sheets whose columns are consumed numerically (spend,
+        sales, ACOS) without materializing Python objects per cell.
+        Requires pyarrow, which is an optional dependency.
+        
+        Returns:
+            pyarrow.Table, or None if pyarrow is missing or fetch failed
+        """
+        try:
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            print("ERROR: pyarrow not installed. Run: pip install pyarrow", file=sys.stderr)
+            return None
+        
+        # Reuse fetch() so retries and error handling stay in one place
+        csv_text = self.fetch()
+        if csv_text is None:
+            return None
+        
+        try:
+            from io import BytesIO
+            return pa_csv.read_csv(BytesIO(csv_text.encode('utf-8')))
+        except Exception as e:
+            print(f"ERROR: Failed to parse CSV with pyarrow: {e}", file=sys.stderr)
+            return None
+    
     def fetch_as_dict_list(self) -> Optional[List[Dict]]:
         """
         Fetch and parse CSV as list of dictionaries.
         
+        Rows are parsed off the streaming response, so the CSV never
+        exists in memory as both a full string and a list of dicts.
+        
         Returns:
             List of dicts (one per row), or None if failed
         """
-        csv_text = self.fetch()
-        if csv_text is None:
+        reader = self.fetch_stream()
+        if reader is None:
             return None
         
         try:
-            reader = csv.DictReader(StringIO(csv_text))
             return list(reader)
         except csv.Error as e:
             print(f"ERROR: Failed to parse CSV: {e}", file=sys.stderr)
             return None
+        except requests.RequestException as e:
+            # The connection can still drop mid-body while rows stream in
+            print(f"ERROR: Connection lost while streaming CSV: {e}", file=sys.stderr)
+            return None
 
 
 def fetch_google_sheet_csv(
@@ -432,7 +432,13 @@ def run_health_check(request) -> Tuple[Dict[str, Any], int]:
         dashboard_ok = False
         try:
             dashboard_client = DashboardClient(config)
-            dashboard_ok = dashboard_client.health_check()
+            try:
+                dashboard_ok = dashboard_client.health_check()
+            finally:
+                # Health checks are polled constantly; dropping the
+                # client without close() would leak its dashboard-tx
+                # thread and session on every poll of a warm instance
+                dashboard_client.close()
         except Exception as e:
             logger.warning(f"Dashboard health check failed: {e}")
         
@@ -934,6 +940,26 @@ Please check the Cloud Functions logs for more details.
             'timestamp': datetime.now().isoformat()
         }, 500
 
+    finally:
+        # Drain and stop the client's background sender before the
+        # response goes out: Cloud Functions throttles CPU after the
+        # handler returns, so anything still queued (the final progress
+        # tick, an error report) would otherwise never be sent - and a
+        # warm instance would leak one dashboard-tx thread per request.
+        if dashboard_client:
+            try:
+                dashboard_client.close()
+            except Exception as close_err:
+                logger.debug(f"Dashboard client shutdown failed: {close_err}")
+        # Same story for the BigQuery client: flush queued rows while we
+        # still have CPU and stop its flusher thread and executor, which
+        # would otherwise pile up one set per request on a warm instance
+        if bigquery_client:
+            try:
+                bigquery_client.close()
+            except Exception as close_err:
+                logger.debug(f"BigQuery client shutdown failed: {close_err}")
+
 
 # Cloud Functions entry point alias.
 #